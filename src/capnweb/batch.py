@@ -394,8 +394,9 @@ async def aiohttp_batch_rpc_handler(
         request: The aiohttp Request object
         local_main: The main object to expose to the client
         options: Optional RPC session options
-        headers: Optional extra response headers (analog of the TS
-            ``nodeHttpBatchRpcResponse`` headers option, batch.ts:174-204)
+        headers: Optional extra response headers, set on the 500 timeout
+            response too (analog of the TS ``nodeHttpBatchRpcResponse``
+            headers option, batch.ts:174-204)
 
     Returns:
         An aiohttp Response object (500 with a plain-text error if the batch
@@ -425,12 +426,16 @@ async def aiohttp_batch_rpc_handler(
     try:
         response_body = await new_http_batch_rpc_response(body, local_main, options)
     except TimeoutError as e:
-        return web.Response(text=str(e), status=500)
+        # Same headers as the 200 path, so a cross-origin caller can still
+        # read the error text.
+        return web.Response(text=str(e), status=500, headers=headers)
 
-    response = web.Response(text=response_body)
-    if headers:
-        response.headers.update(headers)
-    return response
+    # Headers go in at construction: no second pass over the header map.
+    return web.Response(text=response_body, headers=headers)
+
+
+# Cross-origin header for the combined endpoint only (see its warning).
+_CORS_ALLOW_ANY_ORIGIN = {"Access-Control-Allow-Origin": "*"}
 
 
 async def aiohttp_rpc_handler(
@@ -456,10 +461,10 @@ async def aiohttp_rpc_handler(
     from aiohttp import web
 
     if request.method == "POST":
-        response = await aiohttp_batch_rpc_handler(request, local_main, options)
         # See the security warning above (index.ts:150-154).
-        response.headers["Access-Control-Allow-Origin"] = "*"
-        return response
+        return await aiohttp_batch_rpc_handler(
+            request, local_main, options, headers=_CORS_ALLOW_ANY_ORIGIN
+        )
 
     if request.headers.get("Upgrade", "").lower() == "websocket":
         from capnweb.ws_session import handle_websocket_rpc
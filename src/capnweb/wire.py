@@ -595,7 +595,7 @@ WireMessage = (
 )
 
 
-def parse_wire_message(data: str) -> WireMessage:
+def parse_wire_message(data: str | bytes) -> WireMessage:
     """Parse a wire message from JSON string ("string" encoding level).
 
     Uses strict JSON parsing to reject non-standard constants (NaN, Infinity)
@@ -702,7 +702,7 @@ def serialize_wire_message(msg: WireMessage) -> str:
     return _json.dumps(msg.to_json())
 
 
-def parse_wire_batch(data: str) -> list[WireMessage]:
+def parse_wire_batch(data: str | bytes) -> list[WireMessage]:
     """Parse a batch of newline-delimited wire messages.
 
     P5 (perf): natively-framed transports (WebSocket, in-process pipe) deliver
@@ -711,13 +711,17 @@ def parse_wire_batch(data: str) -> list[WireMessage]:
     Only the HTTP-batch transport ever packs multiple newline-delimited
     messages into one frame (contract C-FRAME/D3), which still takes the split
     path below.
+
+    ``data`` may also be raw UTF-8 ``bytes`` (a WebSocket BINARY frame): orjson
+    parses and validates UTF-8 natively, so no Python-level decode is needed.
     """
-    if "\n" not in data:
+    newline = b"\n" if isinstance(data, (bytes, bytearray)) else "\n"
+    if newline not in data:
         stripped = data.strip()
         if not stripped:
             return []
         return [parse_wire_message(stripped)]
-    lines = data.strip().split("\n")
+    lines = data.strip().split(newline)
     return [parse_wire_message(line) for line in lines if line.strip()]
 
 
@@ -39,6 +39,15 @@ WebSocketClientTransport = WebSocketTransport
 WebSocketServerTransport = WebSocketTransport
 
 
+def _max_msg_size(options: RpcSessionOptions | None) -> int:
+    """aiohttp frame cap matching the session's own ``max_message_bytes``.
+
+    aiohttp defaults to 4 MiB, which would reject frames the session is
+    configured to accept; the session check stays the single authority.
+    """
+    return (options or RpcSessionOptions()).max_message_bytes
+
+
 async def wait_closed(session: BidirectionalSession) -> None:
     """Wait until the session ends (aborts or is shut down). Event-driven.
 
@@ -84,7 +93,9 @@ async def new_websocket_rpc_session(
     if isinstance(ws_or_url, str):
         http_session = aiohttp.ClientSession()
         try:
-            ws = await http_session.ws_connect(ws_or_url, heartbeat=heartbeat)
+            ws = await http_session.ws_connect(
+                ws_or_url, heartbeat=heartbeat, max_msg_size=_max_msg_size(options)
+            )
         except BaseException:
             await http_session.close()
             raise
@@ -126,6 +137,7 @@ class WebSocketRpcClient:
         options: RpcSessionOptions | None = None,
         *,
         heartbeat: float | None = None,
+        http_session: aiohttp.ClientSession | None = None,
     ) -> None:
         """Initialize the client.
 
@@ -136,21 +148,28 @@ class WebSocketRpcClient:
             heartbeat: Optional aiohttp WS heartbeat interval in seconds
                 (Python-only extension; aiohttp sends pings and drops dead
                 connections)
+            http_session: Optional caller-owned ``aiohttp.ClientSession`` to
+                connect through (reuses its connector); it is left open on
+                close. By default the client creates and owns its own.
         """
         self.url = url
         self._local_main = local_main
         self._options = options
         self._heartbeat = heartbeat
+        self._shared_http_session = http_session
         self._http_session: aiohttp.ClientSession | None = None
         self._ws: aiohttp.ClientWebSocketResponse | None = None
         self._transport: WebSocketTransport | None = None
         self._session: BidirectionalSession | None = None
+        self._local_main_stub: RpcStub | None = None
 
     async def __aenter__(self) -> "WebSocketRpcClient":
         """Connect to the server."""
-        self._http_session = aiohttp.ClientSession()
+        self._http_session = self._shared_http_session or aiohttp.ClientSession()
         self._ws = await self._http_session.ws_connect(
-            self.url, heartbeat=self._heartbeat
+            self.url,
+            heartbeat=self._heartbeat,
+            max_msg_size=_max_msg_size(self._options),
         )
 
         self._transport = WebSocketTransport(self._ws)
@@ -169,6 +188,10 @@ class WebSocketRpcClient:
 
     async def close(self) -> None:
         """Close the connection."""
+        if self._local_main_stub is not None:
+            # Release the dup() taken by get_local_main_stub().
+            self._local_main_stub.dispose()
+            self._local_main_stub = None
         if self._session:
             # Pre-abort via the public shutdown() so stop() does not try to
             # flush an abort frame over a possibly-dead socket (TS sends no
@@ -185,7 +208,8 @@ class WebSocketRpcClient:
             await self._ws.close()
             self._ws = None
         if self._http_session:
-            await self._http_session.close()
+            if self._http_session is not self._shared_http_session:
+                await self._http_session.close()
             self._http_session = None
 
     def get_main_stub(self) -> RpcStub:
@@ -197,6 +221,22 @@ class WebSocketRpcClient:
     # TS name for the same thing (rpc.ts getRemoteMain).
     get_remote_main = get_main_stub
 
+    def get_local_main_stub(self) -> RpcStub:
+        """Get a stub for our own ``local_main``, to pass to the server.
+
+        Python-only convenience: built on first use and cached for the
+        connection. Passing it as a call argument copies the reference, so
+        the same stub can be sent any number of times.
+        """
+        if self._session is None:
+            raise RuntimeError("Not connected")
+        if self._local_main_stub is None:
+            hook = self._session.get_export(0)
+            if hook is None:
+                raise RuntimeError("No local_main to expose")
+            self._local_main_stub = RpcStub(hook.dup())
+        return self._local_main_stub
+
     async def wait_closed(self) -> None:
         """Wait until the underlying session ends (event-driven)."""
         if self._session is not None:
@@ -243,7 +283,10 @@ async def handle_websocket_rpc(
         app.router.add_get("/rpc", websocket_handler)
         ```
     """
-    ws = web.WebSocketResponse(heartbeat=heartbeat)
+    # No permessage-deflate: RPC frames are small and mostly latency-bound.
+    ws = web.WebSocketResponse(
+        heartbeat=heartbeat, max_msg_size=_max_msg_size(options), compress=False
+    )
     await ws.prepare(request)
 
     transport = WebSocketTransport(ws)
@@ -370,7 +413,11 @@ class WebSocketRpcServer:
 
     async def _handle_ws(self, request: web.Request) -> web.WebSocketResponse:
         """Handle incoming WebSocket connection."""
-        ws = web.WebSocketResponse(heartbeat=self._heartbeat)
+        ws = web.WebSocketResponse(
+            heartbeat=self._heartbeat,
+            max_msg_size=_max_msg_size(self._options),
+            compress=False,
+        )
         await ws.prepare(request)
 
         if self._local_main_factory is not None:
@@ -77,8 +77,13 @@ class WebSocketTransport:
             raise ConnectionError("WebSocket is closed")
         await self._ws.send_str(message)
 
-    async def receive(self) -> str:
-        """Receive a message from the peer."""
+    async def receive(self) -> str | bytes:
+        """Receive a message from the peer.
+
+        TEXT frames arrive as ``str``; BINARY frames are handed over as raw
+        UTF-8 ``bytes`` and parsed without an intermediate decode. Outgoing
+        frames stay TEXT: the TypeScript peer rejects non-string messages.
+        """
         if self._closed:
             raise ConnectionError("WebSocket is closed")
 
@@ -87,7 +92,7 @@ class WebSocketTransport:
         if msg.type == aiohttp.WSMsgType.TEXT:
             return msg.data
         elif msg.type == aiohttp.WSMsgType.BINARY:
-            return msg.data.decode("utf-8")
+            return msg.data
         elif msg.type in (
             aiohttp.WSMsgType.CLOSE,
             aiohttp.WSMsgType.CLOSING,
@@ -167,7 +172,7 @@ class WebSocketConnectingClientTransport(WebSocketTransport):
             raise ConnectionError("WebSocket not connected")
         await super().send(message)
 
-    async def receive(self) -> str:
+    async def receive(self) -> str | bytes:
         if self._ws is None:
             raise ConnectionError("WebSocket not connected")
         return await super().receive()
@@ -7,8 +7,10 @@ for cross-language protocol compliance testing.
 from __future__ import annotations
 
 import asyncio
+import functools
 import gc
 import os
+import shutil
 import signal
 import socket
 import subprocess
@@ -18,16 +20,22 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, AsyncGenerator, Generator
 
+import aiohttp
 import pytest
+import pytest_asyncio
+
+from .test_target import TestTarget
+
+try:
+    import uvloop
+except ImportError:  # optional (interop dependency group); stock loop otherwise
+    uvloop = None
 
 # Paths
 INTEROP_DIR = Path(__file__).parent
 PY_CAPNWEB_DIR = INTEROP_DIR.parent.parent
 SRC_DIR = PY_CAPNWEB_DIR / "src"
 
-# Add src to path
-sys.path.insert(0, str(SRC_DIR))
-
 # Ports - use ephemeral ports to avoid conflicts
 TS_SERVER_BASE_PORT = 19100
 PY_SERVER_BASE_PORT = 19200
@@ -56,16 +64,38 @@ async def wait_for_port(port: int, timeout: float = 10.0) -> bool:
     return False
 
 
-def wait_for_port_sync(port: int, timeout: float = 10.0) -> bool:
-    """Synchronous version of wait_for_port."""
+def wait_for_port_sync(
+    port: int, timeout: float = 10.0, proc: subprocess.Popen | None = None
+) -> bool:
+    """Synchronous version of wait_for_port.
+
+    If ``proc`` is given, gives up as soon as it exits instead of waiting
+    out the full timeout for a server that already died.
+    """
     start = time.time()
     while time.time() - start < timeout:
         if is_port_in_use(port):
             return True
+        if proc is not None and proc.poll() is not None:
+            return False
         time.sleep(0.1)
     return False
 
 
+@functools.lru_cache(maxsize=1)
+def ts_unavailable_reason() -> str | None:
+    """Why the TypeScript server cannot start here, or None if it can.
+
+    Probed once per run so every TS test skips immediately
+    instead of each one timing out on a server that can never come up.
+    """
+    if shutil.which("node") is None or shutil.which("npx") is None:
+        return "Node.js (node/npx) not found on PATH"
+    if not (INTEROP_DIR / "node_modules").exists():
+        return "Run 'npm install' in tests/interop/ first"
+    return None
+
+
 @dataclass
 class ServerProcess:
     """Wrapper for a server subprocess."""
@@ -73,6 +103,12 @@ class ServerProcess:
     process: subprocess.Popen
     port: int
     name: str
+    path: str = "/"
+    url: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Fixed for the server's lifetime; built once, not per test.
+        self.url = f"ws://127.0.0.1:{self.port}{self.path}"
     
     def stop(self, timeout: float = 5.0) -> None:
         """Stop the server gracefully."""
@@ -100,12 +136,10 @@ def start_ts_server(port: int | None = None) -> ServerProcess:
         port = find_free_port()
     print(f"[DEBUG] Using port {port}", flush=True)
     
-    # Check if npm install has been run
-    node_modules = INTEROP_DIR / "node_modules"
-    if not node_modules.exists():
-        raise RuntimeError(
-            "Run 'npm install' in tests/interop/ first"
-        )
+    # Check for node/npx and that npm install has been run
+    reason = ts_unavailable_reason()
+    if reason is not None:
+        raise RuntimeError(reason)
     
     print(f"[DEBUG] Starting npx tsx ts_server.ts {port}", flush=True)
     # Use DEVNULL to prevent pipe buffer deadlock in CI
@@ -119,7 +153,7 @@ def start_ts_server(port: int | None = None) -> ServerProcess:
     print(f"[DEBUG] Process started with PID {proc.pid}", flush=True)
     
     print(f"[DEBUG] Waiting for port {port}...", flush=True)
-    if not wait_for_port_sync(port, timeout=15.0):
+    if not wait_for_port_sync(port, timeout=15.0, proc=proc):
         proc.kill()
         proc.wait()
         raise RuntimeError(f"TypeScript server failed to start on port {port}")
@@ -133,26 +167,34 @@ def start_py_server(port: int | None = None) -> ServerProcess:
     if port is None:
         port = find_free_port()
     
-    # Use DEVNULL to prevent pipe buffer deadlock in CI
+    # Use DEVNULL to prevent pipe buffer deadlock in CI.
+    # Frozen stdlib modules shave interpreter startup (already the default
+    # for release builds, but not for interpreters run from a source tree).
+    # No -O/-OO: pip only precompiles unoptimized .pyc files, so an
+    # optimized run recompiles every dependency and starts slower.
     proc = subprocess.Popen(
-        [sys.executable, "py_server.py", str(port)],
+        [sys.executable, "-X", "frozen_modules=on", "py_server.py", str(port)],
         cwd=INTEROP_DIR,
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
         env={**os.environ, "PYTHONPATH": str(SRC_DIR)},
     )
     
-    if not wait_for_port_sync(port, timeout=15.0):
+    if not wait_for_port_sync(port, timeout=15.0, proc=proc):
         proc.kill()
         proc.wait()
         raise RuntimeError(f"Python server failed to start on port {port}")
     
-    return ServerProcess(process=proc, port=port, name="Python")
+    return ServerProcess(process=proc, port=port, name="Python", path="/rpc")
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def ts_server() -> Generator[ServerProcess, None, None]:
-    """Start TypeScript server for the test module."""
+    """Start one TypeScript server shared by the whole test session.
+
+    Tests that stop or otherwise disturb the server must use
+    ``ts_server_fresh`` instead.
+    """
     try:
         server = start_ts_server()
     except RuntimeError as e:
@@ -164,9 +206,13 @@ def ts_server() -> Generator[ServerProcess, None, None]:
     server.stop()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def py_server() -> Generator[ServerProcess, None, None]:
-    """Start Python server for the test module."""
+    """Start one Python server shared by the whole test session.
+
+    Tests that stop or otherwise disturb the server must use
+    ``py_server_fresh`` instead.
+    """
     try:
         server = start_py_server()
     except RuntimeError as e:
@@ -206,33 +252,97 @@ def py_server_fresh() -> Generator[ServerProcess, None, None]:
     server.stop()
 
 
+if uvloop is not None:
+    # Run every interop test (and async fixture) on uvloop. The hook is
+    # pytest-asyncio's loop-factory extension point; optionalhook keeps
+    # older plugin versions, which lack it, on the stock loop.
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        return {"uvloop": uvloop.new_event_loop}
+
+
 # =============================================================================
 # Client Helpers
 # =============================================================================
 
+# Pseudo-URL selecting InteropClient's in-process (no socket) transport.
+IN_PROCESS_URL = "inproc:"
+
+
 @dataclass
 class InteropClient:
     """Unified client interface for interop testing."""
     
     url: str
+    http_session: Any = field(default=None, repr=False)
+    local_main: Any = field(default=None, repr=False)
     _client: Any = field(default=None, repr=False)
     _session: Any = field(default=None, repr=False)
+    _peer_session: Any = field(default=None, repr=False)
+    _main: Any = field(default=None, repr=False)
+    _methods: dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def in_process(cls, local_main: Any) -> "InteropClient":
+        """Client wired to ``local_main`` over an in-memory queue pair.
+
+        Same session code as the WebSocket path, minus sockets and framing;
+        only meaningful for the Python implementation.
+        """
+        return cls(IN_PROCESS_URL, local_main=local_main)
     
     async def __aenter__(self) -> "InteropClient":
-        from capnweb.ws_session import WebSocketRpcClient
-        self._client = WebSocketRpcClient(self.url)
-        await self._client.__aenter__()
-        self._session = self._client._session
+        if self.url == IN_PROCESS_URL:
+            from capnweb.inprocess import InProcessPipeTransport
+            from capnweb.rpc_session import BidirectionalSession
+            to_server: asyncio.Queue = asyncio.Queue()
+            to_client: asyncio.Queue = asyncio.Queue()
+            self._peer_session = BidirectionalSession(
+                InProcessPipeTransport(to_client, to_server), self.local_main
+            )
+            self._session = BidirectionalSession(
+                InProcessPipeTransport(to_server, to_client)
+            )
+            self._peer_session.start()
+            self._session.start()
+        else:
+            from capnweb.ws_session import WebSocketRpcClient
+            self._client = WebSocketRpcClient(self.url, http_session=self.http_session)
+            await self._client.__aenter__()
+            self._session = self._client._session
+        from capnweb.stubs import RpcStub
+        self._main = RpcStub(self._session.get_main_stub())
+        self._methods = {}
         return self
     
     async def __aexit__(self, *args) -> None:
         if self._client:
             await self._client.__aexit__(*args)
-    
-    async def call(self, method: str, args: list | None = None) -> Any:
-        """Call a method on the remote main capability (via the stub API)."""
-        stub = self._client.get_main_stub()
-        return await getattr(stub, method)(*(args or []))
+        elif self._peer_session:
+            for session in (self._session, self._peer_session):
+                session.shutdown()
+                await session.stop()
+
+    async def call(self, method: str, args: list | tuple | None = None) -> Any:
+        """Call a method on the remote main capability (via the stub API).
+
+        ``args`` are unpacked positionally, so a shared tuple works as well.
+        """
+        return await self.method(method)(*(args or []))
+
+    def method(self, name: str) -> Any:
+        """The cached stub for ``name``; call it like the remote method.
+
+        One main stub per connection and one property stub per method name:
+        repeated calls skip rebuilding the stub chain, and hot loops can
+        bind the stub once instead of looking it up per call. Calling it
+        returns an RpcPromise (awaitable, not a coroutine): gather it, or
+        go through ``call`` where a coroutine is needed (TaskGroup).
+        """
+        target = self._methods.get(name)
+        if target is None:
+            target = self._methods[name] = getattr(self._main, name)
+        return target
     
     async def call_with_timeout(
         self, method: str, args: list | None = None, timeout: float = 5.0
@@ -246,6 +356,7 @@ class InteropClient:
         self, method: str, args: list | None = None
     ) -> Exception:
         """Call a method expecting it to raise an error."""
+        __tracebackhide__ = True
         try:
             await self.call(method, args)
             raise AssertionError(f"Expected error from {method}")
@@ -261,7 +372,7 @@ class InteropClient:
 def py_client_to_ts(ts_server: ServerProcess):
     """Create a Python client connected to TypeScript server."""
     async def _create():
-        client = InteropClient(f"ws://127.0.0.1:{ts_server.port}/")
+        client = InteropClient(ts_server.url)
         await client.__aenter__()
         return client
     return _create
@@ -271,12 +382,126 @@ def py_client_to_ts(ts_server: ServerProcess):
 def py_client_to_py(py_server: ServerProcess):
     """Create a Python client connected to Python server."""
     async def _create():
-        client = InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc")
+        client = InteropClient(py_server.url)
         await client.__aenter__()
         return client
     return _create
 
 
+def shared_server_url(request: pytest.FixtureRequest, kind: str) -> str:
+    """WebSocket URL of the session's shared ``kind`` ("ts"/"py") server.
+
+    For fixtures that need their own client (e.g. one exposing a local
+    main) rather than the shared ``interop_client``.
+    """
+    server: ServerProcess = request.getfixturevalue(f"{kind}_server")
+    return server.url
+
+
+def _kind_url(request: pytest.FixtureRequest, kind: str) -> str:
+    """Connect URL for ``kind``: the shared server's, or IN_PROCESS_URL."""
+    if kind == "inproc":
+        return IN_PROCESS_URL
+    return shared_server_url(request, kind)
+
+
+def _client_for_url(url: str, http_session: Any = None) -> InteropClient:
+    """A new, not yet connected InteropClient for ``url``.
+
+    IN_PROCESS_URL wires a fresh Python TestTarget in this process, with no
+    subprocess or socket; any other URL is a WebSocket server.
+    """
+    if url == IN_PROCESS_URL:
+        return InteropClient.in_process(TestTarget())
+    return InteropClient(url, http_session=http_session)
+
+
+def new_interop_client(request: pytest.FixtureRequest, kind: str) -> InteropClient:
+    """A new, not yet connected InteropClient for ``kind``.
+
+    ``ts`` / ``py`` target the session's shared server; ``inproc`` wires a
+    fresh Python TestTarget in this process.
+    """
+    return _client_for_url(_kind_url(request, kind))
+
+
+class InteropClientPool:
+    """Connected InteropClients keyed by URL, all closed in one ``aclose``.
+
+    Lets every test reuse one live connection per server instead of paying
+    a WebSocket handshake and CLOSE handshake per test.
+    """
+
+    def __init__(self, http_session: aiohttp.ClientSession) -> None:
+        self._http_session = http_session
+        self._clients: dict[str, InteropClient] = {}
+
+    async def get_client(self, url: str) -> InteropClient:
+        """Return the connected client for ``url``, connecting on first use."""
+        client = self._clients.get(url)
+        if client is None:
+            client = _client_for_url(url, self._http_session)
+            await client.__aenter__()
+            # One warm-up round trip per connection, so tests need not
+            # prove the session is live before their real assertion.
+            assert await client.call("square", [0]) == 0
+            self._clients[url] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close every pooled client."""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.__aexit__(None, None, None)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_http() -> AsyncGenerator[aiohttp.ClientSession, None]:
+    """One aiohttp ClientSession (connector, resolver cache) per test session.
+
+    Lives on the session loop because a ClientSession is bound to the loop
+    it was created on; only the per-client ``ws_connect`` is per-client.
+    """
+    connector = aiohttp.TCPConnector(limit=0, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(
+        connector=connector, read_bufsize=4 * 1024 * 1024
+    ) as session:
+        yield session
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def interop_pool(
+    shared_http: aiohttp.ClientSession,
+) -> AsyncGenerator[InteropClientPool, None]:
+    """Session-wide client pool; closes every pooled client at session end."""
+    pool = InteropClientPool(shared_http)
+    try:
+        yield pool
+    finally:
+        await pool.aclose()
+
+
+@pytest_asyncio.fixture(
+    loop_scope="session",
+    params=["ts", "py", pytest.param("inproc", marks=pytest.mark.inproc)],
+)
+async def interop_client(
+    request, interop_pool: InteropClientPool
+) -> InteropClient:
+    """The pooled, already-connected client for one server kind.
+
+    Every test of a kind shares one connection for the whole session.
+    Tests using it must run on the session loop: mark them
+    ``@pytest.mark.asyncio(loop_scope="session")``. Tests that need a
+    pristine session should keep opening their own InteropClient.
+
+    The ``inproc`` kind runs the Python TestTarget in this process over an
+    in-memory pipe: no subprocess or socket, so it isolates protocol
+    behaviour from transport cost.
+    """
+    return await interop_pool.get_client(_kind_url(request, request.param))
+
+
 # =============================================================================
 # Wire Format Utilities
 # =============================================================================
@@ -316,20 +541,20 @@ class MockTransport:
 
 
 def parse_wire_messages(raw: str) -> list[Any]:
-    """Parse wire messages from a raw string."""
-    import json
+    """Parse wire messages from a raw string (same codec as the session)."""
+    from capnweb import _json
     messages = []
     for line in raw.strip().split("\n"):
         if line:
-            messages.append(json.loads(line))
+            messages.append(_json.loads(line))
     return messages
 
 
 def assert_wire_contains(messages: list[str], expected_type: str) -> Any:
     """Assert that messages contain a specific type."""
-    import json
+    from capnweb import _json
     for msg in messages:
-        parsed = json.loads(msg) if isinstance(msg, str) else msg
+        parsed = _json.loads(msg) if isinstance(msg, str) else msg
         if isinstance(parsed, list) and parsed and parsed[0] == expected_type:
             return parsed
     raise AssertionError(f"No {expected_type} message found in {messages}")
@@ -8,11 +8,15 @@ Usage: python tests/interop/py_server.py <port>
 """
 
 import asyncio
+import contextlib
+import signal
 import sys
 from aiohttp import web
 
-# Add src to path for imports
-sys.path.insert(0, str(__file__).replace('/tests/interop/py_server.py', '/src'))
+try:
+    import uvloop
+except ImportError:  # optional: falls back to the stock asyncio loop
+    uvloop = None
 
 from capnweb.ws_session import handle_websocket_rpc, WebSocketServerTransport
 from capnweb.batch import aiohttp_batch_rpc_handler
@@ -22,59 +26,84 @@ from capnweb.rpc_session import BidirectionalSession
 from test_target import TestTarget
 
 
+# Built once and shared by the preflight and POST paths.
+_CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'POST, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type',
+    'Access-Control-Max-Age': '86400',
+}
+
+
 async def websocket_handler(request: web.Request) -> web.WebSocketResponse:
-    """Handle WebSocket RPC connections."""
+    """Handle WebSocket RPC connections (one TestTarget per session)."""
     return await handle_websocket_rpc(request, TestTarget())
 
 
 async def batch_handler(request: web.Request) -> web.Response:
     """Handle HTTP batch RPC requests."""
-    return await aiohttp_batch_rpc_handler(request, TestTarget())
+    return await aiohttp_batch_rpc_handler(
+        request, TestTarget(), headers=_CORS_HEADERS
+    )
+
+
+async def preflight_handler(request: web.Request) -> web.Response:
+    """Answer CORS preflight directly; it never reaches the RPC layer."""
+    return web.Response(status=204, headers=_CORS_HEADERS)
 
 
 async def main(port: int) -> None:
     """Start the server."""
-    app = web.Application()
-    
-    # Route based on request type
-    async def unified_handler(request: web.Request) -> web.StreamResponse:
-        if request.headers.get('Upgrade', '').lower() == 'websocket':
-            return await websocket_handler(request)
-        elif request.method == 'POST':
-            response = await batch_handler(request)
-            response.headers['Access-Control-Allow-Origin'] = '*'
-            return response
-        else:
-            return web.Response(
-                text="This endpoint only accepts POST or WebSocket requests.",
-                status=400
-            )
+    # Accept batch bodies up to the session's inbound frame bound
+    # (RpcSessionConfig.max_message_bytes, 16 MiB) instead of aiohttp's 1 MiB.
+    app = web.Application(client_max_size=16 * 1024 * 1024)
     
-    app.router.add_route('*', '/', unified_handler)
-    app.router.add_route('*', '/rpc', unified_handler)
+    # Dispatch on method in aiohttp's router rather than by hand: GET is the
+    # WebSocket upgrade (a plain GET gets aiohttp's 400 from prepare()),
+    # POST is HTTP batch, and any other method gets a 405.
+    for path in ('/', '/rpc'):
+        app.router.add_get(path, websocket_handler)
+        app.router.add_post(path, batch_handler)
+        app.router.add_route('OPTIONS', path, preflight_handler)
     
-    runner = web.AppRunner(app)
+    # Live RPC sessions never finish on their own; cap the graceful wait so
+    # shutdown completes well inside ServerProcess.stop()'s kill deadline
+    # (aiohttp's default is 60s).
+    runner = web.AppRunner(app, shutdown_timeout=1.0)
     await runner.setup()
-    site = web.TCPSite(runner, '127.0.0.1', port)
+    # Deep accept backlog so connection bursts from the concurrency/stress
+    # suites queue in the kernel instead of being refused. reuse_address lets
+    # a restarted server rebind a port still in TIME_WAIT. TCP_NODELAY needs
+    # no socket factory: asyncio and uvloop both set it on accepted sockets.
+    site = web.TCPSite(
+        runner, '127.0.0.1', port, backlog=4096, reuse_address=True
+    )
     await site.start()
     
     print(f"Python interop server listening on 127.0.0.1:{port}")
     print(f"WebSocket: ws://127.0.0.1:{port}/rpc")
     print(f"HTTP Batch: http://127.0.0.1:{port}/")
     
-    # Keep running until interrupted
+    # Block until SIGINT/SIGTERM (ServerProcess.stop sends SIGINT); no
+    # periodic wakeups, and shutdown takes the normal cleanup path.
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        with contextlib.suppress(NotImplementedError):  # Windows
+            loop.add_signal_handler(sig, stop.set)
     try:
-        while True:
-            await asyncio.sleep(3600)
-    except asyncio.CancelledError:
-        pass
+        await stop.wait()
+        print("Shutting down...")
     finally:
         await runner.cleanup()
 
 
 if __name__ == '__main__':
     port = int(sys.argv[1]) if len(sys.argv) > 1 else 9200
+    # uvloop (libuv-backed) cuts per-frame scheduling overhead on the
+    # many-small-RPC interop workload.
+    run = uvloop.run if uvloop is not None else asyncio.run
     try:
-        asyncio.run(main(port))
+        run(main(port))
     except KeyboardInterrupt:
         print("Shutting down...")
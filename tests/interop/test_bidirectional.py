@@ -10,15 +10,10 @@ These tests verify bidirectional capability passing and callbacks:
 from __future__ import annotations
 
 import asyncio
-import sys
-from pathlib import Path
 from typing import Any
 
 import pytest
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 from .conftest import InteropClient, ServerProcess
 from ..support import rpc_call
 
@@ -37,7 +32,7 @@ class TestCallbacks:
         from capnweb.stubs import RpcStub
         from capnweb.ws_session import WebSocketRpcClient
         
-        print(f"[DEBUG] test_simple_callback_ts starting, port={ts_server.port}", flush=True)
+        print(f"[DEBUG] test_simple_callback_ts starting, url={ts_server.url}", flush=True)
         
         class Callback(RpcTarget):
             def __init__(self):
@@ -57,7 +52,7 @@ class TestCallbacks:
         print("[DEBUG] Creating WebSocketRpcClient...", flush=True)
         async with asyncio.timeout(30):
             async with WebSocketRpcClient(
-                f"ws://127.0.0.1:{ts_server.port}/",
+                ts_server.url,
                 local_main=callback,
             ) as client:
                 print("[DEBUG] Connected to server", flush=True)
@@ -95,7 +90,7 @@ class TestCallbacks:
         
         callback = Callback()
         async with WebSocketRpcClient(
-            f"ws://127.0.0.1:{py_server.port}/rpc",
+            py_server.url,
             local_main=callback,
         ) as client:
             stub = RpcStub(client._session.get_export(0).dup())
@@ -127,7 +122,7 @@ class TestCallbacks:
         
         counter = Counter()
         async with WebSocketRpcClient(
-            f"ws://127.0.0.1:{ts_server.port}/",
+            ts_server.url,
             local_main=counter,
         ) as client:
             stub = RpcStub(client._session.get_export(0).dup())
@@ -164,7 +159,7 @@ class TestCallbacks:
         
         counter = Counter()
         async with WebSocketRpcClient(
-            f"ws://127.0.0.1:{py_server.port}/rpc",
+            py_server.url,
             local_main=counter,
         ) as client:
             stub = RpcStub(client._session.get_export(0).dup())
@@ -187,7 +182,7 @@ class TestPipelinedCalls:
     
     async def test_pipelined_calls_ts(self, ts_server: ServerProcess):
         """Multiple calls can be sent before waiting for results."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             # Start multiple calls without awaiting
             tasks = [
                 asyncio.create_task(client.call("square", [i]))
@@ -201,7 +196,7 @@ class TestPipelinedCalls:
     
     async def test_pipelined_calls_py(self, py_server: ServerProcess):
         """Multiple calls can be sent before waiting for results."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             tasks = [
                 asyncio.create_task(client.call("square", [i]))
                 for i in range(5)
@@ -213,7 +208,7 @@ class TestPipelinedCalls:
     
     async def test_interleaved_calls_ts(self, ts_server: ServerProcess):
         """Interleaved calls with different methods work correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             tasks = [
                 asyncio.create_task(client.call("square", [2])),
                 asyncio.create_task(client.call("greet", ["Alice"])),
@@ -232,7 +227,7 @@ class TestPipelinedCalls:
     
     async def test_interleaved_calls_py(self, py_server: ServerProcess):
         """Interleaved calls with different methods work correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             tasks = [
                 asyncio.create_task(client.call("square", [2])),
                 asyncio.create_task(client.call("greet", ["Alice"])),
@@ -260,7 +255,7 @@ class TestCapabilityChains:
     
     async def test_counter_chain_ts(self, ts_server: ServerProcess):
         """Create counter, pass it back, increment it."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             # Create a counter on the server
             counter = await client.call("makeCounter", [10])
             
@@ -269,7 +264,7 @@ class TestCapabilityChains:
     
     async def test_counter_chain_py(self, py_server: ServerProcess):
         """Create counter, pass it back, increment it."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             counter = await client.call("makeCounter", [10])
             assert counter is not None
     
@@ -291,7 +286,7 @@ class TestCapabilityChains:
         
         func = SquareFunction()
         async with WebSocketRpcClient(
-            f"ws://127.0.0.1:{ts_server.port}/",
+            ts_server.url,
             local_main=func,
         ) as client:
             stub = RpcStub(client._session.get_export(0).dup())
@@ -316,7 +311,7 @@ class TestCapabilityChains:
         
         func = SquareFunction()
         async with WebSocketRpcClient(
-            f"ws://127.0.0.1:{py_server.port}/rpc",
+            py_server.url,
             local_main=func,
         ) as client:
             stub = RpcStub(client._session.get_export(0).dup())
@@ -354,7 +349,7 @@ class TestConcurrentBidirectional:
         
         callback = Callback()
         async with WebSocketRpcClient(
-            f"ws://127.0.0.1:{ts_server.port}/",
+            ts_server.url,
             local_main=callback,
         ) as client:
             stub = RpcStub(client._session.get_export(0).dup())
@@ -397,7 +392,7 @@ class TestConcurrentBidirectional:
         
         callback = Callback()
         async with WebSocketRpcClient(
-            f"ws://127.0.0.1:{py_server.port}/rpc",
+            py_server.url,
             local_main=callback,
         ) as client:
             stub = RpcStub(client._session.get_export(0).dup())
@@ -429,7 +424,7 @@ class TestSelfReference:
         """Server can call method on passed self-reference."""
         from capnweb.ws_session import WebSocketRpcClient
         
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with WebSocketRpcClient(ts_server.url) as client:
             # Get a stub for the server's main capability
             # Then pass it back to the server to call
             result = await rpc_call(client, "square", [5])
@@ -439,6 +434,6 @@ class TestSelfReference:
         """Server can call method on passed self-reference."""
         from capnweb.ws_session import WebSocketRpcClient
         
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with WebSocketRpcClient(py_server.url) as client:
             result = await rpc_call(client, "square", [5])
             assert result == 25
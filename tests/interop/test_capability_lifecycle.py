@@ -10,15 +10,10 @@ These tests verify proper handling of capability references including:
 from __future__ import annotations
 
 import asyncio
-import sys
-from pathlib import Path
 from typing import Any
 
 import pytest
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 from .conftest import InteropClient, ServerProcess
 from ..support import rpc_call
 
@@ -33,7 +28,7 @@ class TestCapabilityPassing:
     
     async def test_server_returns_capability_ts(self, ts_server: ServerProcess):
         """Server can return a capability (Counter) to client."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             # makeCounter returns a Counter capability
             counter = await client.call("makeCounter", [10])
             # The counter should be a stub we can use
@@ -41,7 +36,7 @@ class TestCapabilityPassing:
     
     async def test_server_returns_capability_py(self, py_server: ServerProcess):
         """Server can return a capability (Counter) to client."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             counter = await client.call("makeCounter", [10])
             assert counter is not None
     
@@ -67,7 +62,7 @@ class TestCapabilityPassing:
         
         local = ClientCallback()
         async with WebSocketRpcClient(
-            f"ws://127.0.0.1:{ts_server.port}/",
+            ts_server.url,
             local_main=local,
         ) as client:
             assert client._session is not None
@@ -104,7 +99,7 @@ class TestCapabilityPassing:
         
         local = ClientCallback()
         async with WebSocketRpcClient(
-            f"ws://127.0.0.1:{py_server.port}/rpc",
+            py_server.url,
             local_main=local,
         ) as client:
             assert client._session is not None
@@ -130,26 +125,38 @@ class TestReleaseMessages:
         """Release message is sent after capability is resolved."""
         from capnweb.ws_session import WebSocketRpcClient
         
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            # Make a call that returns a capability
-            counter = await rpc_call(client, "makeCounter", [10])
-            
-            # The session should have tracked the import
+        async with WebSocketRpcClient(ts_server.url) as client:
             session = client._session
             assert session is not None
+            baseline = session.get_stats()["imports"]
+            
+            # Make a call that returns a capability; the session tracks
+            # the import while the stub is alive
+            with await rpc_call(client, "makeCounter", [10]) as counter:
+                assert counter is not None
+                assert session.get_stats()["imports"] == baseline + 1
             
-            # After the call resolves, we should have an import entry
-            # When we dispose of the stub, a release should be sent
-            # This is tested implicitly by the session cleanup
+            # Disposing the stub sends the release and frees the import slot
+            assert session.get_stats()["imports"] == baseline
+            
+            # The server processed the release without breaking the session
+            assert await rpc_call(client, "square", [3]) == 9
     
     async def test_release_sent_after_resolve_py(self, py_server: ServerProcess):
         """Release message is sent after capability is resolved."""
         from capnweb.ws_session import WebSocketRpcClient
         
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            counter = await rpc_call(client, "makeCounter", [10])
+        async with WebSocketRpcClient(py_server.url) as client:
             session = client._session
             assert session is not None
+            baseline = session.get_stats()["imports"]
+            
+            with await rpc_call(client, "makeCounter", [10]) as counter:
+                assert counter is not None
+                assert session.get_stats()["imports"] == baseline + 1
+            
+            assert session.get_stats()["imports"] == baseline
+            assert await rpc_call(client, "square", [3]) == 9
 
 
 # =============================================================================
@@ -162,7 +169,7 @@ class TestMultipleReferences:
     
     async def test_multiple_calls_same_capability_ts(self, ts_server: ServerProcess):
         """Multiple calls to the same capability work correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             # Multiple calls to the main capability
             results = await asyncio.gather(
                 client.call("square", [1]),
@@ -173,7 +180,7 @@ class TestMultipleReferences:
     
     async def test_multiple_calls_same_capability_py(self, py_server: ServerProcess):
         """Multiple calls to the same capability work correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             results = await asyncio.gather(
                 client.call("square", [1]),
                 client.call("square", [2]),
@@ -194,7 +201,7 @@ class TestCapabilityCleanup:
         """Session cleanup releases all capabilities."""
         from capnweb.ws_session import WebSocketRpcClient
         
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with WebSocketRpcClient(ts_server.url) as client:
             # Make several calls
             await rpc_call(client, "square", [5])
             await rpc_call(client, "greet", ["World"])
@@ -215,7 +222,7 @@ class TestCapabilityCleanup:
         """Session cleanup releases all capabilities."""
         from capnweb.ws_session import WebSocketRpcClient
         
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with WebSocketRpcClient(py_server.url) as client:
             await rpc_call(client, "square", [5])
             await rpc_call(client, "greet", ["World"])
             await rpc_call(client, "generateFibonacci", [5])
@@ -255,7 +262,7 @@ class TestBidirectionalCapabilities:
         
         local = ClientCallback()
         async with WebSocketRpcClient(
-            f"ws://127.0.0.1:{ts_server.port}/",
+            ts_server.url,
             local_main=local,
         ) as client:
             callback_stub = RpcStub(client._session.get_export(0).dup())
@@ -289,7 +296,7 @@ class TestBidirectionalCapabilities:
         
         local = ClientCallback()
         async with WebSocketRpcClient(
-            f"ws://127.0.0.1:{py_server.port}/rpc",
+            py_server.url,
             local_main=local,
         ) as client:
             callback_stub = RpcStub(client._session.get_export(0).dup())
@@ -23,38 +23,38 @@ class TestCleanShutdown:
     
     async def test_client_closes_cleanly_ts(self, ts_server: ServerProcess):
         """Client can close connection cleanly after calls."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             result = await client.call("square", [5])
             assert result == 25
         # Connection should be closed cleanly here
     
     async def test_client_closes_cleanly_py(self, py_server: ServerProcess):
         """Client can close connection cleanly after calls."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             result = await client.call("square", [5])
             assert result == 25
     
     async def test_client_closes_without_calls_ts(self, ts_server: ServerProcess):
         """Client can close connection without making any calls."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             pass  # Just connect and disconnect
     
     async def test_client_closes_without_calls_py(self, py_server: ServerProcess):
         """Client can close connection without making any calls."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             pass
     
     async def test_multiple_sessions_sequential_ts(self, ts_server: ServerProcess):
         """Multiple sequential sessions work correctly."""
         for i in range(5):
-            async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+            async with InteropClient(ts_server.url) as client:
                 result = await client.call("square", [i])
                 assert result == i * i
     
     async def test_multiple_sessions_sequential_py(self, py_server: ServerProcess):
         """Multiple sequential sessions work correctly."""
         for i in range(5):
-            async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+            async with InteropClient(py_server.url) as client:
                 result = await client.call("square", [i])
                 assert result == i * i
 
@@ -69,7 +69,7 @@ class TestConnectionState:
     
     async def test_call_after_close_fails_ts(self, ts_server: ServerProcess):
         """Calling after connection close raises error."""
-        client = InteropClient(f"ws://127.0.0.1:{ts_server.port}/")
+        client = InteropClient(ts_server.url)
         await client.__aenter__()
         
         result = await client.call("square", [5])
@@ -83,7 +83,7 @@ class TestConnectionState:
     
     async def test_call_after_close_fails_py(self, py_server: ServerProcess):
         """Calling after connection close raises error."""
-        client = InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc")
+        client = InteropClient(py_server.url)
         await client.__aenter__()
         
         result = await client.call("square", [5])
@@ -96,14 +96,14 @@ class TestConnectionState:
     
     async def test_double_close_safe_ts(self, ts_server: ServerProcess):
         """Closing connection twice doesn't raise error."""
-        client = InteropClient(f"ws://127.0.0.1:{ts_server.port}/")
+        client = InteropClient(ts_server.url)
         await client.__aenter__()
         await client.__aexit__(None, None, None)
         await client.__aexit__(None, None, None)  # Should not raise
     
     async def test_double_close_safe_py(self, py_server: ServerProcess):
         """Closing connection twice doesn't raise error."""
-        client = InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc")
+        client = InteropClient(py_server.url)
         await client.__aenter__()
         await client.__aexit__(None, None, None)
         await client.__aexit__(None, None, None)
@@ -120,36 +120,36 @@ class TestReconnection:
     async def test_reconnect_after_close_ts(self, ts_server: ServerProcess):
         """Can reconnect after closing connection."""
         # First connection
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             result = await client.call("square", [5])
             assert result == 25
         
         # Second connection (reconnect)
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             result = await client.call("square", [6])
             assert result == 36
     
     async def test_reconnect_after_close_py(self, py_server: ServerProcess):
         """Can reconnect after closing connection."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             result = await client.call("square", [5])
             assert result == 25
         
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             result = await client.call("square", [6])
             assert result == 36
     
     async def test_many_reconnects_ts(self, ts_server: ServerProcess):
         """Many reconnections work correctly."""
         for i in range(10):
-            async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+            async with InteropClient(ts_server.url) as client:
                 result = await client.call("add", [i, 1])
                 assert result == i + 1
     
     async def test_many_reconnects_py(self, py_server: ServerProcess):
         """Many reconnections work correctly."""
         for i in range(10):
-            async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+            async with InteropClient(py_server.url) as client:
                 result = await client.call("add", [i, 1])
                 assert result == i + 1
 
@@ -165,7 +165,7 @@ class TestConcurrentConnections:
     async def test_multiple_concurrent_clients_ts(self, ts_server: ServerProcess):
         """Multiple clients can connect concurrently."""
         async def client_task(client_id: int) -> int:
-            async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+            async with InteropClient(ts_server.url) as client:
                 result = await client.call("square", [client_id])
                 return result
         
@@ -177,7 +177,7 @@ class TestConcurrentConnections:
     async def test_multiple_concurrent_clients_py(self, py_server: ServerProcess):
         """Multiple clients can connect concurrently."""
         async def client_task(client_id: int) -> int:
-            async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+            async with InteropClient(py_server.url) as client:
                 result = await client.call("square", [client_id])
                 return result
         
@@ -189,11 +189,11 @@ class TestConcurrentConnections:
     async def test_concurrent_clients_different_calls_ts(self, ts_server: ServerProcess):
         """Concurrent clients making different calls work."""
         async def square_client(n: int) -> int:
-            async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+            async with InteropClient(ts_server.url) as client:
                 return await client.call("square", [n])
         
         async def add_client(a: int, b: int) -> int:
-            async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+            async with InteropClient(ts_server.url) as client:
                 return await client.call("add", [a, b])
         
         tasks = [
@@ -209,11 +209,11 @@ class TestConcurrentConnections:
     async def test_concurrent_clients_different_calls_py(self, py_server: ServerProcess):
         """Concurrent clients making different calls work."""
         async def square_client(n: int) -> int:
-            async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+            async with InteropClient(py_server.url) as client:
                 return await client.call("square", [n])
         
         async def add_client(a: int, b: int) -> int:
-            async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+            async with InteropClient(py_server.url) as client:
                 return await client.call("add", [a, b])
         
         tasks = [
@@ -237,7 +237,7 @@ class TestErrorRecovery:
     
     async def test_call_after_error_ts(self, ts_server: ServerProcess):
         """Can make calls after an error."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             # First call fails
             try:
                 await client.call("throwError", ["test"])
@@ -250,7 +250,7 @@ class TestErrorRecovery:
     
     async def test_call_after_error_py(self, py_server: ServerProcess):
         """Can make calls after an error."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             try:
                 await client.call("throwError", ["test"])
             except Exception:
@@ -261,7 +261,7 @@ class TestErrorRecovery:
     
     async def test_multiple_errors_then_success_ts(self, ts_server: ServerProcess):
         """Multiple errors followed by success works."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             for _ in range(3):
                 try:
                     await client.call("throwError", ["test"])
@@ -273,7 +273,7 @@ class TestErrorRecovery:
     
     async def test_multiple_errors_then_success_py(self, py_server: ServerProcess):
         """Multiple errors followed by success works."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             for _ in range(3):
                 try:
                     await client.call("throwError", ["test"])
@@ -300,7 +300,7 @@ class TestAbruptDisconnect:
     
     async def test_session_handles_close_gracefully_ts(self, ts_server: ServerProcess):
         """Session handles close without pending calls gracefully."""
-        client = InteropClient(f"ws://127.0.0.1:{ts_server.port}/")
+        client = InteropClient(ts_server.url)
         await client.__aenter__()
         
         # Make a call to ensure connection is established
@@ -312,7 +312,7 @@ class TestAbruptDisconnect:
     
     async def test_session_handles_close_gracefully_py(self, py_server: ServerProcess):
         """Session handles close without pending calls gracefully."""
-        client = InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc")
+        client = InteropClient(py_server.url)
         await client.__aenter__()
         
         result = await client.call("square", [5])
@@ -10,267 +10,186 @@ These tests verify handling of unusual but valid inputs including:
 from __future__ import annotations
 
 import asyncio
-import sys
-from pathlib import Path
+import functools
 from typing import Any
 
 import pytest
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
-from .conftest import InteropClient, ServerProcess
+from .conftest import InteropClient
+
+
+# (value, description) tables shared by the pipelined echo tests below.
+SPECIAL_CHARS = (
+    ("\n", "newline"),
+    ("\t", "tab"),
+    ("\r", "carriage return"),
+    ("\"", "double quote"),
+    ("'", "single quote"),
+    ("\\", "backslash"),
+    ("/", "forward slash"),
+    ("<", "less than"),
+    (">", "greater than"),
+    ("&", "ampersand"),
+    ("\x00", "null byte"),
+)
+
+UNICODE_TEXTS = (
+    ("日本語", "Japanese"),
+    ("中文", "Chinese"),
+    ("한국어", "Korean"),
+    ("العربية", "Arabic"),
+    ("עברית", "Hebrew"),
+    ("Ελληνικά", "Greek"),
+    ("Русский", "Russian"),
+    ("🎉🚀💻🌍", "Emoji"),
+    ("👨‍👩‍👧‍👦", "Family emoji"),
+    ("🏳️‍🌈", "Rainbow flag"),
+)
+
+NUMERIC_VALUES = (
+    (0, "zero"),
+    (-0.0, "negative zero"),
+    (1e10, "large positive"),
+    (-1e10, "large negative"),
+    (1e-10, "small positive"),
+    (-1e-10, "small negative"),
+    (2**31 - 1, "max int32"),
+    (-(2**31), "min int32"),
+    (2**53 - 1, "max safe integer"),
+    (-(2**53 - 1), "min safe integer"),
+)
+
+
+# Large echo payloads, built once; serialization never mutates its input.
+_LARGE_STRING = "x" * 10000
+_LARGE_ARRAY = list(range(1000))
+_LARGE_OBJECT = {f"key_{i}": i for i in range(100)}
+
+
+@functools.lru_cache(maxsize=1)
+def _deep_obj() -> dict:
+    """10-level nested object, built once per run (echo never mutates it)."""
+    obj: dict = {"value": "deep"}
+    for i in range(10):
+        obj = {f"level_{i}": obj}
+    return obj
+
+
+@functools.lru_cache(maxsize=1)
+def _deep_arr() -> list:
+    """10-level nested array, built once per run."""
+    arr: list = ["deep"]
+    for _ in range(10):
+        arr = [arr]
+    return arr
 
 
 # =============================================================================
 # Empty Value Tests
 # =============================================================================
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestEmptyValues:
     """Test handling of empty values."""
     
-    async def test_empty_string_ts(self, ts_server: ServerProcess):
-        """Empty string round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            result = await client.call("echo", [""])
-            assert result == ""
-    
-    async def test_empty_string_py(self, py_server: ServerProcess):
+    async def test_empty_string(self, interop_client: InteropClient):
         """Empty string round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result = await client.call("echo", [""])
-            assert result == ""
-    
-    async def test_empty_array_ts(self, ts_server: ServerProcess):
-        """Empty array round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            result = await client.call("echo", [[]])
-            assert result == []
+        result = await interop_client.call("echo", [""])
+        assert result == ""
     
-    async def test_empty_array_py(self, py_server: ServerProcess):
+    async def test_empty_array(self, interop_client: InteropClient):
         """Empty array round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result = await client.call("echo", [[]])
-            assert result == []
-    
-    async def test_empty_object_ts(self, ts_server: ServerProcess):
-        """Empty object round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            result = await client.call("echo", [{}])
-            assert result == {}
+        result = await interop_client.call("echo", [[]])
+        assert result == []
     
-    async def test_empty_object_py(self, py_server: ServerProcess):
+    async def test_empty_object(self, interop_client: InteropClient):
         """Empty object round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result = await client.call("echo", [{}])
-            assert result == {}
+        result = await interop_client.call("echo", [{}])
+        assert result == {}
     
-    async def test_null_ts(self, ts_server: ServerProcess):
+    async def test_null(self, interop_client: InteropClient):
         """Null value round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            result = await client.call("echo", [None])
-            assert result is None
-    
-    async def test_null_py(self, py_server: ServerProcess):
-        """Null value round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result = await client.call("echo", [None])
-            assert result is None
+        result = await interop_client.call("echo", [None])
+        assert result is None
 
 
 # =============================================================================
 # Large Payload Tests
 # =============================================================================
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestLargePayloads:
     """Test handling of large payloads."""
     
-    async def test_large_string_ts(self, ts_server: ServerProcess):
-        """Large string (10KB) round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            large_string = "x" * 10000
-            result = await client.call("echo", [large_string])
-            assert result == large_string
-    
-    async def test_large_string_py(self, py_server: ServerProcess):
+    async def test_large_string(self, interop_client: InteropClient):
         """Large string (10KB) round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            large_string = "x" * 10000
-            result = await client.call("echo", [large_string])
-            assert result == large_string
+        result = await interop_client.call("echo", [_LARGE_STRING])
+        assert result == _LARGE_STRING
     
-    async def test_large_array_ts(self, ts_server: ServerProcess):
+    async def test_large_array(self, interop_client: InteropClient):
         """Large array (1000 elements) round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            large_array = list(range(1000))
-            result = await client.call("echo", [large_array])
-            assert result == large_array
-    
-    async def test_large_array_py(self, py_server: ServerProcess):
-        """Large array (1000 elements) round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            large_array = list(range(1000))
-            result = await client.call("echo", [large_array])
-            assert result == large_array
-    
-    async def test_large_object_ts(self, ts_server: ServerProcess):
-        """Large object (100 keys) round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            large_object = {f"key_{i}": i for i in range(100)}
-            result = await client.call("echo", [large_object])
-            assert result == large_object
+        result = await interop_client.call("echo", [_LARGE_ARRAY])
+        assert result == _LARGE_ARRAY
     
-    async def test_large_object_py(self, py_server: ServerProcess):
+    async def test_large_object(self, interop_client: InteropClient):
         """Large object (100 keys) round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            large_object = {f"key_{i}": i for i in range(100)}
-            result = await client.call("echo", [large_object])
-            assert result == large_object
+        result = await interop_client.call("echo", [_LARGE_OBJECT])
+        assert result == _LARGE_OBJECT
 
 
 # =============================================================================
 # Deeply Nested Structure Tests
 # =============================================================================
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestDeeplyNested:
     """Test handling of deeply nested structures."""
     
-    async def test_deeply_nested_object_ts(self, ts_server: ServerProcess):
+    async def test_deeply_nested_object(self, interop_client: InteropClient):
         """Deeply nested object (10 levels) round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            # Build nested object
-            obj: dict = {"value": "deep"}
-            for i in range(10):
-                obj = {f"level_{i}": obj}
-            
-            result = await client.call("echo", [obj])
-            assert result == obj
+        obj = _deep_obj()
+        result = await interop_client.call("echo", [obj])
+        assert result == obj
     
-    async def test_deeply_nested_object_py(self, py_server: ServerProcess):
-        """Deeply nested object (10 levels) round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            obj: dict = {"value": "deep"}
-            for i in range(10):
-                obj = {f"level_{i}": obj}
-            
-            result = await client.call("echo", [obj])
-            assert result == obj
-    
-    async def test_deeply_nested_array_ts(self, ts_server: ServerProcess):
-        """Deeply nested array (10 levels) round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            arr: list = ["deep"]
-            for _ in range(10):
-                arr = [arr]
-            
-            result = await client.call("echo", [arr])
-            assert result == arr
-    
-    async def test_deeply_nested_array_py(self, py_server: ServerProcess):
+    async def test_deeply_nested_array(self, interop_client: InteropClient):
         """Deeply nested array (10 levels) round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            arr: list = ["deep"]
-            for _ in range(10):
-                arr = [arr]
-            
-            result = await client.call("echo", [arr])
-            assert result == arr
+        arr = _deep_arr()
+        result = await interop_client.call("echo", [arr])
+        assert result == arr
 
 
 # =============================================================================
 # Special Character Tests
 # =============================================================================
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestSpecialCharacters:
     """Test handling of special characters."""
     
-    @pytest.mark.parametrize("char,name", [
-        ("\n", "newline"),
-        ("\t", "tab"),
-        ("\r", "carriage return"),
-        ("\"", "double quote"),
-        ("'", "single quote"),
-        ("\\", "backslash"),
-        ("/", "forward slash"),
-        ("<", "less than"),
-        (">", "greater than"),
-        ("&", "ampersand"),
-        ("\x00", "null byte"),
-    ])
-    async def test_special_char_ts(self, ts_server: ServerProcess, char: str, name: str):
-        """Special character round-trips correctly through TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            test_string = f"before{char}after"
-            result = await client.call("echo", [test_string])
-            assert result == test_string, f"Failed for {name}"
-    
-    @pytest.mark.parametrize("char,name", [
-        ("\n", "newline"),
-        ("\t", "tab"),
-        ("\r", "carriage return"),
-        ("\"", "double quote"),
-        ("'", "single quote"),
-        ("\\", "backslash"),
-        ("/", "forward slash"),
-        ("<", "less than"),
-        (">", "greater than"),
-        ("&", "ampersand"),
-        ("\x00", "null byte"),
-    ])
-    async def test_special_char_py(self, py_server: ServerProcess, char: str, name: str):
-        """Special character round-trips correctly through Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            test_string = f"before{char}after"
-            result = await client.call("echo", [test_string])
-            assert result == test_string, f"Failed for {name}"
+    async def test_special_chars(self, interop_client: InteropClient):
+        """Special characters round-trip correctly (pipelined on one session)."""
+        inputs = [f"before{char}after" for char, _ in SPECIAL_CHARS]
+        results = await asyncio.gather(
+            *(interop_client.call("echo", [text]) for text in inputs)
+        )
+        for (_, name), sent, result in zip(SPECIAL_CHARS, inputs, results):
+            assert result == sent, f"Failed for {name}"
 
 
 # =============================================================================
 # Unicode Tests
 # =============================================================================
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestUnicode:
     """Test handling of unicode characters."""
     
-    @pytest.mark.parametrize("text,name", [
-        ("日本語", "Japanese"),
-        ("中文", "Chinese"),
-        ("한국어", "Korean"),
-        ("العربية", "Arabic"),
-        ("עברית", "Hebrew"),
-        ("Ελληνικά", "Greek"),
-        ("Русский", "Russian"),
-        ("🎉🚀💻🌍", "Emoji"),
-        ("👨‍👩‍👧‍👦", "Family emoji"),
-        ("🏳️‍🌈", "Rainbow flag"),
-    ])
-    async def test_unicode_ts(self, ts_server: ServerProcess, text: str, name: str):
-        """Unicode text round-trips correctly through TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            result = await client.call("echo", [text])
-            assert result == text, f"Failed for {name}"
-    
-    @pytest.mark.parametrize("text,name", [
-        ("日本語", "Japanese"),
-        ("中文", "Chinese"),
-        ("한국어", "Korean"),
-        ("العربية", "Arabic"),
-        ("עברית", "Hebrew"),
-        ("Ελληνικά", "Greek"),
-        ("Русский", "Russian"),
-        ("🎉🚀💻🌍", "Emoji"),
-        ("👨‍👩‍👧‍👦", "Family emoji"),
-        ("🏳️‍🌈", "Rainbow flag"),
-    ])
-    async def test_unicode_py(self, py_server: ServerProcess, text: str, name: str):
-        """Unicode text round-trips correctly through Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result = await client.call("echo", [text])
+    async def test_unicode(self, interop_client: InteropClient):
+        """Unicode text round-trips correctly (pipelined on one session)."""
+        results = await asyncio.gather(
+            *(interop_client.call("echo", [text]) for text, _ in UNICODE_TEXTS)
+        )
+        for (text, name), result in zip(UNICODE_TEXTS, results):
             assert result == text, f"Failed for {name}"
 
 
@@ -278,44 +197,16 @@ class TestUnicode:
 # Numeric Edge Cases
 # =============================================================================
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestNumericEdgeCases:
     """Test handling of numeric edge cases."""
     
-    @pytest.mark.parametrize("value,name", [
-        (0, "zero"),
-        (-0.0, "negative zero"),
-        (1e10, "large positive"),
-        (-1e10, "large negative"),
-        (1e-10, "small positive"),
-        (-1e-10, "small negative"),
-        (2**31 - 1, "max int32"),
-        (-(2**31), "min int32"),
-        (2**53 - 1, "max safe integer"),
-        (-(2**53 - 1), "min safe integer"),
-    ])
-    async def test_numeric_ts(self, ts_server: ServerProcess, value, name: str):
-        """Numeric value round-trips correctly through TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            result = await client.call("echo", [value])
-            assert result == value, f"Failed for {name}"
-    
-    @pytest.mark.parametrize("value,name", [
-        (0, "zero"),
-        (-0.0, "negative zero"),
-        (1e10, "large positive"),
-        (-1e10, "large negative"),
-        (1e-10, "small positive"),
-        (-1e-10, "small negative"),
-        (2**31 - 1, "max int32"),
-        (-(2**31), "min int32"),
-        (2**53 - 1, "max safe integer"),
-        (-(2**53 - 1), "min safe integer"),
-    ])
-    async def test_numeric_py(self, py_server: ServerProcess, value, name: str):
-        """Numeric value round-trips correctly through Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result = await client.call("echo", [value])
+    async def test_numeric(self, interop_client: InteropClient):
+        """Numeric values round-trip correctly (pipelined on one session)."""
+        results = await asyncio.gather(
+            *(interop_client.call("echo", [value]) for value, _ in NUMERIC_VALUES)
+        )
+        for (value, name), result in zip(NUMERIC_VALUES, results):
             assert result == value, f"Failed for {name}"
 
 
@@ -323,58 +214,32 @@ class TestNumericEdgeCases:
 # Boolean Edge Cases
 # =============================================================================
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestBooleanEdgeCases:
     """Test handling of boolean values."""
     
-    async def test_true_ts(self, ts_server: ServerProcess):
-        """True value round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            result = await client.call("echo", [True])
-            assert result is True
-    
-    async def test_true_py(self, py_server: ServerProcess):
+    async def test_true(self, interop_client: InteropClient):
         """True value round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result = await client.call("echo", [True])
-            assert result is True
+        result = await interop_client.call("echo", [True])
+        assert result is True
     
-    async def test_false_ts(self, ts_server: ServerProcess):
+    async def test_false(self, interop_client: InteropClient):
         """False value round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            result = await client.call("echo", [False])
-            assert result is False
-    
-    async def test_false_py(self, py_server: ServerProcess):
-        """False value round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result = await client.call("echo", [False])
-            assert result is False
-    
-    async def test_boolean_not_confused_with_int_ts(self, ts_server: ServerProcess):
-        """Boolean values are not confused with integers."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            # In some languages, True == 1 and False == 0
-            # Make sure we preserve the type
-            result_true = await client.call("echo", [True])
-            result_one = await client.call("echo", [1])
-            result_false = await client.call("echo", [False])
-            result_zero = await client.call("echo", [0])
-            
-            assert result_true is True
-            assert result_one == 1
-            assert result_false is False
-            assert result_zero == 0
+        result = await interop_client.call("echo", [False])
+        assert result is False
     
-    async def test_boolean_not_confused_with_int_py(self, py_server: ServerProcess):
+    async def test_boolean_not_confused_with_int(self, interop_client: InteropClient):
         """Boolean values are not confused with integers."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result_true = await client.call("echo", [True])
-            result_one = await client.call("echo", [1])
-            result_false = await client.call("echo", [False])
-            result_zero = await client.call("echo", [0])
-            
-            assert result_true is True
-            assert result_one == 1
-            assert result_false is False
-            assert result_zero == 0
+        # In some languages, True == 1 and False == 0
+        # Make sure we preserve the type
+        result_true, result_one, result_false, result_zero = await asyncio.gather(
+            interop_client.call("echo", [True]),
+            interop_client.call("echo", [1]),
+            interop_client.call("echo", [False]),
+            interop_client.call("echo", [0]),
+        )
+        
+        assert result_true is True
+        assert result_one == 1
+        assert result_false is False
+        assert result_zero == 0
@@ -10,270 +10,168 @@ These tests verify proper error propagation and handling including:
 from __future__ import annotations
 
 import asyncio
-import sys
-from pathlib import Path
-from typing import Any
+from typing import Any, AsyncGenerator
 
 import pytest
+import pytest_asyncio
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+from capnweb.error import RpcError
+from capnweb.stubs import RpcStub
+from capnweb.types import RpcTarget
+from capnweb.ws_session import WebSocketRpcClient
 
-from .conftest import InteropClient, ServerProcess
+from .conftest import InteropClient, ServerProcess, shared_server_url
 from ..support import rpc_call
 
 
+class ErrorCallback(RpcTarget):
+    """Client-side callback whose ``notify`` always raises."""
+    
+    async def call(self, method: str, args: list) -> Any:
+        if method == "notify":
+            raise ValueError("Callback error!")
+        raise ValueError(f"Unknown method: {method}")
+    
+    def get_property(self, name: str) -> Any:
+        raise AttributeError(f"Unknown property: {name}")
+
+
 # =============================================================================
 # Server Exception Tests
 # =============================================================================
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestServerExceptions:
     """Test that server exceptions are properly propagated to client."""
     
-    async def test_server_throws_error_ts(self, ts_server: ServerProcess):
+    async def test_server_throws_error(self, interop_client: InteropClient):
         """Server exception is propagated to client."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            with pytest.raises(Exception) as exc_info:
-                await client.call("throwError", [])
-            
-            # Should contain error information
-            error = exc_info.value
-            assert error is not None
-    
-    async def test_server_throws_error_py(self, py_server: ServerProcess):
-        """Server exception is propagated to client."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            with pytest.raises(Exception) as exc_info:
-                await client.call("throwError", [])
-            
-            error = exc_info.value
-            assert error is not None
-    
-    async def test_error_does_not_break_session_ts(self, ts_server: ServerProcess):
-        """Error in one call doesn't break subsequent calls."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            # First call succeeds
-            result1 = await client.call("square", [5])
-            assert result1 == 25
-            
-            # Second call throws error
-            with pytest.raises(Exception):
-                await client.call("throwError", [])
-            
-            # Third call should still work
-            result3 = await client.call("square", [6])
-            assert result3 == 36
+        with pytest.raises(RpcError) as exc_info:
+            await interop_client.call("throwError", [])
+        
+        # Should contain error information
+        error = exc_info.value
+        assert error is not None
     
-    async def test_error_does_not_break_session_py(self, py_server: ServerProcess):
+    async def test_error_does_not_break_session(self, interop_client: InteropClient):
         """Error in one call doesn't break subsequent calls."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result1 = await client.call("square", [5])
-            assert result1 == 25
-            
-            with pytest.raises(Exception):
-                await client.call("throwError", [])
-            
-            result3 = await client.call("square", [6])
-            assert result3 == 36
+        # The pooled client already made a successful warm-up call; the
+        # follow-up is only sent once the error has been received
+        with pytest.raises(RpcError):
+            await interop_client.call("throwError", [])
+        
+        assert await interop_client.call("square", [6]) == 36
 
 
 # =============================================================================
 # Method Not Found Tests
 # =============================================================================
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestMethodNotFound:
     """Test handling of calls to non-existent methods."""
     
-    async def test_unknown_method_ts(self, ts_server: ServerProcess):
-        """Calling unknown method raises error."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            with pytest.raises(Exception) as exc_info:
-                await client.call("nonExistentMethod", [])
-            
-            # Should get an error
-            assert exc_info.value is not None
-    
-    async def test_unknown_method_py(self, py_server: ServerProcess):
+    async def test_unknown_method(self, interop_client: InteropClient):
         """Calling unknown method raises error."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            with pytest.raises(Exception) as exc_info:
-                await client.call("nonExistentMethod", [])
-            
-            assert exc_info.value is not None
-    
-    async def test_unknown_method_does_not_break_session_ts(self, ts_server: ServerProcess):
-        """Unknown method error doesn't break subsequent calls."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            result1 = await client.call("square", [5])
-            assert result1 == 25
-            
-            with pytest.raises(Exception):
-                await client.call("nonExistentMethod", [])
-            
-            result3 = await client.call("square", [6])
-            assert result3 == 36
+        with pytest.raises(RpcError) as exc_info:
+            await interop_client.call("nonExistentMethod", [])
+        
+        # Should get an error
+        assert exc_info.value is not None
     
-    async def test_unknown_method_does_not_break_session_py(self, py_server: ServerProcess):
+    async def test_unknown_method_does_not_break_session(
+        self, interop_client: InteropClient
+    ):
         """Unknown method error doesn't break subsequent calls."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result1 = await client.call("square", [5])
-            assert result1 == 25
-            
-            with pytest.raises(Exception):
-                await client.call("nonExistentMethod", [])
-            
-            result3 = await client.call("square", [6])
-            assert result3 == 36
+        with pytest.raises(RpcError):
+            await interop_client.call("nonExistentMethod", [])
+        
+        assert await interop_client.call("square", [6]) == 36
 
 
 # =============================================================================
 # Concurrent Error Tests
 # =============================================================================
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestConcurrentErrors:
     """Test error handling with concurrent calls."""
     
-    async def test_concurrent_calls_with_one_error_ts(self, ts_server: ServerProcess):
+    async def test_concurrent_calls_with_one_error(self, interop_client: InteropClient):
         """One error in concurrent calls doesn't affect others."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            async def call_square(n):
-                return await client.call("square", [n])
-            
-            async def call_error():
-                try:
-                    await client.call("throwError", [])
-                    return "no error"
-                except Exception as e:
-                    return f"error: {type(e).__name__}"
-            
-            # Mix of successful calls and one error
-            results = await asyncio.gather(
-                call_square(1),
-                call_square(2),
-                call_error(),
-                call_square(3),
-                call_square(4),
-            )
-            
-            assert results[0] == 1
-            assert results[1] == 4
-            assert "error" in results[2]
-            assert results[3] == 9
-            assert results[4] == 16
-    
-    async def test_concurrent_calls_with_one_error_py(self, py_server: ServerProcess):
-        """One error in concurrent calls doesn't affect others."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            async def call_square(n):
-                return await client.call("square", [n])
-            
-            async def call_error():
-                try:
-                    await client.call("throwError", [])
-                    return "no error"
-                except Exception as e:
-                    return f"error: {type(e).__name__}"
-            
-            results = await asyncio.gather(
-                call_square(1),
-                call_square(2),
-                call_error(),
-                call_square(3),
-                call_square(4),
-            )
-            
-            assert results[0] == 1
-            assert results[1] == 4
-            assert "error" in results[2]
-            assert results[3] == 9
-            assert results[4] == 16
+        async def call_square(n):
+            return await interop_client.call("square", [n])
+        
+        async def call_error():
+            try:
+                await interop_client.call("throwError", [])
+                return "no error"
+            except Exception as e:
+                return f"error: {type(e).__name__}"
+        
+        # Mix of successful calls and one error. call_error catches the
+        # failure itself, so the TaskGroup never cancels the other calls.
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(call_square(1)),
+                tg.create_task(call_square(2)),
+                tg.create_task(call_error()),
+                tg.create_task(call_square(3)),
+                tg.create_task(call_square(4)),
+            ]
+        results = [task.result() for task in tasks]
+        
+        assert results[0] == 1
+        assert results[1] == 4
+        assert "error" in results[2]
+        assert results[3] == 9
+        assert results[4] == 16
 
 
 # =============================================================================
 # Callback Error Tests
 # =============================================================================
 
-@pytest.mark.asyncio
+@pytest_asyncio.fixture(scope="class", loop_scope="session", params=["ts", "py"])
+async def error_callback_client(request) -> AsyncGenerator[WebSocketRpcClient, None]:
+    """Client exposing an ErrorCallback, registered with the server once.
+
+    Shared by the class so the export-table entry and registerCallback
+    round trip happen once per server kind, not once per test.
+    """
+    url = shared_server_url(request, request.param)
+    async with WebSocketRpcClient(url, local_main=ErrorCallback()) as client:
+        callback_stub = RpcStub(client._session.get_export(0).dup())
+        await rpc_call(client, "registerCallback", [callback_stub])
+        yield client
+
+
+@pytest.mark.asyncio(loop_scope="session")
 class TestCallbackErrors:
     """Test error handling in callbacks."""
     
-    async def test_callback_throws_error_ts(self, ts_server: ServerProcess):
+    async def test_callback_throws_error(
+        self, error_callback_client: WebSocketRpcClient
+    ):
         """Error in client callback is propagated back to server."""
-        from capnweb.types import RpcTarget
-        from capnweb.stubs import RpcStub
-        from capnweb.ws_session import WebSocketRpcClient
-        
-        class ErrorCallback(RpcTarget):
-            async def call(self, method: str, args: list) -> Any:
-                if method == "notify":
-                    raise ValueError("Callback error!")
-                raise ValueError(f"Unknown method: {method}")
-            
-            def get_property(self, name: str) -> Any:
-                raise AttributeError(f"Unknown property: {name}")
-        
-        local = ErrorCallback()
-        async with WebSocketRpcClient(
-            f"ws://127.0.0.1:{ts_server.port}/",
-            local_main=local,
-        ) as client:
-            callback_stub = RpcStub(client._session.get_export(0).dup())
-            await rpc_call(client, "registerCallback", [callback_stub])
-            
-            # When server calls callback, it should get an error
-            with pytest.raises(Exception):
-                await rpc_call(client, "triggerCallback", [])
-    
-    async def test_callback_throws_error_py(self, py_server: ServerProcess):
-        """Error in client callback is propagated back to server."""
-        from capnweb.types import RpcTarget
-        from capnweb.stubs import RpcStub
-        from capnweb.ws_session import WebSocketRpcClient
-        
-        class ErrorCallback(RpcTarget):
-            async def call(self, method: str, args: list) -> Any:
-                if method == "notify":
-                    raise ValueError("Callback error!")
-                raise ValueError(f"Unknown method: {method}")
-            
-            def get_property(self, name: str) -> Any:
-                raise AttributeError(f"Unknown property: {name}")
-        
-        local = ErrorCallback()
-        async with WebSocketRpcClient(
-            f"ws://127.0.0.1:{py_server.port}/rpc",
-            local_main=local,
-        ) as client:
-            callback_stub = RpcStub(client._session.get_export(0).dup())
-            await rpc_call(client, "registerCallback", [callback_stub])
-            
-            with pytest.raises(Exception):
-                await rpc_call(client, "triggerCallback", [])
+        # When server calls callback, it should get an error
+        with pytest.raises(RpcError):
+            await rpc_call(error_callback_client, "triggerCallback", [])
 
 
 # =============================================================================
 # Timeout Tests
 # =============================================================================
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 class TestTimeouts:
     """Test timeout handling."""
     
-    async def test_client_timeout_ts(self, ts_server: ServerProcess):
-        """Client-side timeout works correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            # Normal call should complete quickly
-            result = await client.call_with_timeout("square", [5], timeout=5.0)
-            assert result == 25
-    
-    async def test_client_timeout_py(self, py_server: ServerProcess):
+    async def test_client_timeout(self, interop_client: InteropClient):
         """Client-side timeout works correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result = await client.call_with_timeout("square", [5], timeout=5.0)
-            assert result == 25
+        # Normal call should complete quickly
+        result = await interop_client.call_with_timeout("square", [5], timeout=0.5)
+        assert result == 25
 
 
 # =============================================================================
@@ -286,43 +184,39 @@ class TestConnectionErrors:
     
     async def test_connect_to_nonexistent_server(self):
         """Connecting to non-existent server raises error."""
-        from capnweb.ws_session import WebSocketRpcClient
-        
         with pytest.raises(Exception):
             async with WebSocketRpcClient("ws://127.0.0.1:59999/") as client:
                 await rpc_call(client, "square", [5])
     
     async def test_server_shutdown_during_call_ts(self, ts_server_fresh: ServerProcess):
         """Server shutdown during call is handled gracefully."""
-        from capnweb.ws_session import WebSocketRpcClient
-        
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{ts_server_fresh.port}/") as client:
+        async with WebSocketRpcClient(ts_server_fresh.url) as client:
             # Make a successful call first
             result = await rpc_call(client, "square", [5])
             assert result == 25
             
-            # Stop the server
+            # Stop the server, then yield once so the client reads the close
             ts_server_fresh.stop()
+            await asyncio.sleep(0.01)
             
             # Next call should fail
             with pytest.raises(Exception):
                 await asyncio.wait_for(
                     rpc_call(client, "square", [6]),
-                    timeout=5.0
+                    timeout=0.5
                 )
     
     async def test_server_shutdown_during_call_py(self, py_server_fresh: ServerProcess):
         """Server shutdown during call is handled gracefully."""
-        from capnweb.ws_session import WebSocketRpcClient
-        
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{py_server_fresh.port}/rpc") as client:
+        async with WebSocketRpcClient(py_server_fresh.url) as client:
             result = await rpc_call(client, "square", [5])
             assert result == 25
             
             py_server_fresh.stop()
+            await asyncio.sleep(0.01)
             
             with pytest.raises(Exception):
                 await asyncio.wait_for(
                     rpc_call(client, "square", [6]),
-                    timeout=5.0
+                    timeout=0.5
                 )
@@ -22,15 +22,11 @@ Test Scenarios:
 from __future__ import annotations
 
 import subprocess
-import sys
 from pathlib import Path
 from typing import Any
 
 import pytest
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
-
 from capnweb.ws_session import WebSocketRpcClient
 from capnweb.stubs import RpcStub
 from capnweb.types import RpcTarget
@@ -53,80 +49,80 @@ class TestPyClientTsServer:
     
     async def test_simple_square(self, ts_server: ServerProcess):
         """Test simple square call."""
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with WebSocketRpcClient(ts_server.url) as client:
             result = await rpc_call(client, "square", [5])
             assert result == 25
     
     async def test_add(self, ts_server: ServerProcess):
         """Test add call."""
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with WebSocketRpcClient(ts_server.url) as client:
             result = await rpc_call(client, "add", [3, 7])
             assert result == 10
     
     async def test_greet(self, ts_server: ServerProcess):
         """Test greet call."""
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with WebSocketRpcClient(ts_server.url) as client:
             result = await rpc_call(client, "greet", ["World"])
             assert result == "Hello, World!"
     
     async def test_echo_string(self, ts_server: ServerProcess):
         """Test echo with string."""
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with WebSocketRpcClient(ts_server.url) as client:
             result = await rpc_call(client, "echo", ["test message"])
             assert result == "test message"
     
     async def test_echo_number(self, ts_server: ServerProcess):
         """Test echo with number."""
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with WebSocketRpcClient(ts_server.url) as client:
             result = await rpc_call(client, "echo", [42])
             assert result == 42
     
     async def test_echo_array(self, ts_server: ServerProcess):
         """Test echo with array."""
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with WebSocketRpcClient(ts_server.url) as client:
             result = await rpc_call(client, "echo", [[1, 2, 3]])
             assert result == [1, 2, 3]
     
     async def test_echo_nested_object(self, ts_server: ServerProcess):
         """Test echo with nested object."""
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with WebSocketRpcClient(ts_server.url) as client:
             obj = {"foo": {"bar": 123}, "baz": [1, 2, 3]}
             result = await rpc_call(client, "echo", [obj])
             assert result == obj
     
     async def test_generate_fibonacci(self, ts_server: ServerProcess):
         """Test generateFibonacci."""
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with WebSocketRpcClient(ts_server.url) as client:
             result = await rpc_call(client, "generateFibonacci", [10])
             assert result == [0, 1, 1, 2, 3, 5, 8, 13, 21, 34]
     
     async def test_get_list(self, ts_server: ServerProcess):
         """Test getList."""
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with WebSocketRpcClient(ts_server.url) as client:
             result = await rpc_call(client, "getList", [])
             assert result == [1, 2, 3, 4, 5]
     
     async def test_return_null(self, ts_server: ServerProcess):
         """Test returnNull."""
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with WebSocketRpcClient(ts_server.url) as client:
             result = await rpc_call(client, "returnNull", [])
             assert result is None
     
     async def test_return_number(self, ts_server: ServerProcess):
         """Test returnNumber."""
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with WebSocketRpcClient(ts_server.url) as client:
             result = await rpc_call(client, "returnNumber", [123])
             assert result == 123
     
     async def test_throw_error(self, ts_server: ServerProcess):
         """Test throwError returns an error."""
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with WebSocketRpcClient(ts_server.url) as client:
             with pytest.raises(Exception):
                 await rpc_call(client, "throwError", [])
     
     async def test_make_counter(self, ts_server: ServerProcess):
         """Test makeCounter returns a capability."""
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with WebSocketRpcClient(ts_server.url) as client:
             # Get counter capability
             counter = await rpc_call(client, "makeCounter", [10])
             # Counter should be a stub we can call
@@ -151,7 +147,7 @@ class TestPyClientTsServer:
         local = ClientCallback()
         
         async with WebSocketRpcClient(
-            f"ws://127.0.0.1:{ts_server.port}/",
+            ts_server.url,
             local_main=local,
         ) as client:
             assert client._session is not None
@@ -177,31 +173,31 @@ class TestPyClientPyServer:
     
     async def test_simple_square(self, py_server: ServerProcess):
         """Test simple square call."""
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with WebSocketRpcClient(py_server.url) as client:
             result = await rpc_call(client, "square", [5])
             assert result == 25
     
     async def test_add(self, py_server: ServerProcess):
         """Test add call."""
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with WebSocketRpcClient(py_server.url) as client:
             result = await rpc_call(client, "add", [3, 7])
             assert result == 10
     
     async def test_greet(self, py_server: ServerProcess):
         """Test greet call."""
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with WebSocketRpcClient(py_server.url) as client:
             result = await rpc_call(client, "greet", ["World"])
             assert result == "Hello, World!"
     
     async def test_echo_array(self, py_server: ServerProcess):
         """Test echo with array."""
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with WebSocketRpcClient(py_server.url) as client:
             result = await rpc_call(client, "echo", [[1, 2, 3]])
             assert result == [1, 2, 3]
     
     async def test_generate_fibonacci(self, py_server: ServerProcess):
         """Test generateFibonacci."""
-        async with WebSocketRpcClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with WebSocketRpcClient(py_server.url) as client:
             result = await rpc_call(client, "generateFibonacci", [10])
             assert result == [0, 1, 1, 2, 3, 5, 8, 13, 21, 34]
     
@@ -224,7 +220,7 @@ class TestPyClientPyServer:
         local = ClientCallback()
         
         async with WebSocketRpcClient(
-            f"ws://127.0.0.1:{py_server.port}/rpc",
+            py_server.url,
             local_main=local,
         ) as client:
             assert client._session is not None
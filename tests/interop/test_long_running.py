@@ -23,16 +23,12 @@ See README.md in this directory for full documentation.
 from __future__ import annotations
 
 import asyncio
-import sys
 import time
-from pathlib import Path
+from dataclasses import dataclass
 from typing import Any
 
 import pytest
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 from capnweb.types import RpcTarget
 from capnweb.stubs import RpcStub
 from capnweb.ws_session import WebSocketRpcClient
@@ -48,54 +44,90 @@ except ImportError:
 # Duration in seconds (5 minutes)
 DEMO_DURATION = 300
 
-# Protocol compatibility test cases - basic RPC
+
+@dataclass(frozen=True)
+class ApproxEq:
+    """Expected float result, matched within ``tolerance``."""
+
+    value: float
+    tolerance: float
+
+    def check(self, result: Any) -> bool:
+        return abs(result - self.value) < self.tolerance
+
+
+# Protocol compatibility test cases - basic RPC. Args tuples and expected
+# values are shared by every iteration of the loop (and by every connection),
+# so neither the caller nor a handler may mutate them.
 BASIC_TEST_CASES = [
-    # (method, args, expected_result_checker, description)
-    ("square", [5], lambda r: r == 25, "square(5) = 25"),
-    ("square", [0], lambda r: r == 0, "square(0) = 0"),
-    ("square", [-3], lambda r: r == 9, "square(-3) = 9"),
-    ("add", [10, 20], lambda r: r == 30, "add(10, 20) = 30"),
-    ("add", [-5, 5], lambda r: r == 0, "add(-5, 5) = 0"),
-    ("greet", ["World"], lambda r: r == "Hello, World!", "greet string"),
-    ("greet", [""], lambda r: r == "Hello, !", "greet empty string"),
+    # (method, args, expected_result, description)
+    ("square", (5,), 25, "square(5) = 25"),
+    ("square", (0,), 0, "square(0) = 0"),
+    ("square", (-3,), 9, "square(-3) = 9"),
+    ("add", (10, 20), 30, "add(10, 20) = 30"),
+    ("add", (-5, 5), 0, "add(-5, 5) = 0"),
+    ("greet", ("World",), "Hello, World!", "greet string"),
+    ("greet", ("",), "Hello, !", "greet empty string"),
 ]
 
 # Wire format compatibility test cases
 WIRE_FORMAT_TEST_CASES = [
-    ("echo", [None], lambda r: r is None, "null"),
-    ("echo", [True], lambda r: r is True, "boolean true"),
-    ("echo", [False], lambda r: r is False, "boolean false"),
-    ("echo", [42], lambda r: r == 42, "integer"),
-    ("echo", [3.14], lambda r: abs(r - 3.14) < 0.001, "float"),
-    ("echo", ["hello"], lambda r: r == "hello", "string"),
-    ("echo", [[1, 2, 3]], lambda r: r == [1, 2, 3], "array of ints"),
-    ("echo", [{"a": 1, "b": 2}], lambda r: r == {"a": 1, "b": 2}, "object"),
-    ("echo", [[{"nested": [1, 2]}]], lambda r: r == [{"nested": [1, 2]}], "nested structure"),
-    ("echo", [[]], lambda r: r == [], "empty array"),
-    ("echo", [{}], lambda r: r == {}, "empty object"),
-    ("echo", [[1, "two", 3.0, None]], lambda r: r == [1, "two", 3.0, None], "mixed array"),
+    ("echo", (None,), None, "null"),
+    ("echo", (True,), True, "boolean true"),
+    ("echo", (False,), False, "boolean false"),
+    ("echo", (42,), 42, "integer"),
+    ("echo", (3.14,), ApproxEq(3.14, 0.001), "float"),
+    ("echo", ("hello",), "hello", "string"),
+    ("echo", ([1, 2, 3],), [1, 2, 3], "array of ints"),
+    ("echo", ({"a": 1, "b": 2},), {"a": 1, "b": 2}, "object"),
+    ("echo", ([{"nested": [1, 2]}],), [{"nested": [1, 2]}], "nested structure"),
+    ("echo", ([],), [], "empty array"),
+    ("echo", ({},), {}, "empty object"),
+    ("echo", ([1, "two", 3.0, None],), [1, "two", 3.0, None], "mixed array"),
 ]
 
 # Combine all test cases
 PROTOCOL_TEST_CASES = BASIC_TEST_CASES + WIRE_FORMAT_TEST_CASES
 
+# Cap on calls in flight at once (protocol, capability and callback tests
+# together), and the protocol test cases queued per loop iteration as a
+# multiple of that cap: windows hold several times more calls than the
+# semaphore admits, so it, not the end-of-window drain, bounds concurrency
+MAX_IN_FLIGHT = 32
+WINDOW_FACTOR = 4
+
+# Deadline in seconds for each window of calls to complete
+CALL_TIMEOUT = 10.0
+
 
 class BidirectionalCallback(RpcTarget):
     """Client-side callback that server can call."""
     
+    # RpcTarget has no __slots__, so instances keep a __dict__; the slots
+    # still give these hot attributes direct descriptor access.
+    __slots__ = ("ping_count", "last_ping_time", "errors")
+    
     def __init__(self):
         self.ping_count = 0
         self.last_ping_time = 0.0
         self.errors: list[str] = []
     
     async def call(self, method: str, args: list) -> Any:
-        if method == "notify":
-            self.ping_count += 1
-            self.last_ping_time = time.time()
-            return f"pong-{self.ping_count}"
-        elif method == "echo":
-            return args[0] if args else None
-        raise ValueError(f"Unknown method: {method}")
+        handler = self._HANDLERS.get(method)
+        if handler is None:
+            raise ValueError(f"Unknown method: {method}")
+        return getattr(self, handler)(args)
+    
+    def _notify(self, args: list) -> str:
+        self.ping_count += 1
+        self.last_ping_time = asyncio.get_running_loop().time()
+        return f"pong-{self.ping_count}"
+    
+    def _echo(self, args: list) -> Any:
+        return args[0] if args else None
+    
+    # Method name -> handler attribute; one dict lookup per callback.
+    _HANDLERS = {"notify": "_notify", "echo": "_echo"}
     
     def get_property(self, name: str) -> Any:
         if name == "pingCount":
@@ -108,17 +140,20 @@ async def run_protocol_compatibility_demo(
     duration: float,
     server_name: str,
     client_lang: str = "Python",
+    max_in_flight: int = MAX_IN_FLIGHT,
 ) -> dict:
     """Run protocol compatibility demo for specified duration.
     
     Tests wire format compatibility between Python and TypeScript.
-    Returns stats about the demo run.
+    Calls run as fast as the server answers them, with at most
+    ``max_in_flight`` outstanding at once. Returns stats about the demo run.
     """
     callback = BidirectionalCallback()
     stats = {
         "server": server_name,
         "client": client_lang,
         "duration": duration,
+        "max_in_flight": max_in_flight,
         "client_calls": 0,
         "server_callbacks": 0,
         "protocol_tests_passed": 0,
@@ -128,6 +163,20 @@ async def run_protocol_compatibility_demo(
         "errors": [],
         "start_time": time.time(),
     }
+    # The loop bumps these locals and writes them back to ``stats`` at each
+    # progress report and once at the end; errors are appended in place.
+    calls = passed = failed = callbacks = cap_creates = cap_calls = 0
+    errors: list[str] = stats["errors"]
+    
+    def flush_stats() -> None:
+        stats.update(
+            client_calls=calls,
+            server_callbacks=callbacks,
+            protocol_tests_passed=passed,
+            protocol_tests_failed=failed,
+            capability_creates=cap_creates,
+            capability_calls=cap_calls,
+        )
     
     print(f"\n{'='*60}")
     print(f"Protocol Compatibility Test: {client_lang} client <-> {server_name} server")
@@ -141,98 +190,144 @@ async def run_protocol_compatibility_demo(
             local_main=callback,
         ) as client:
             # Register callback with server
-            stub = RpcStub(client._session.get_export(0).dup())
-            await rpc_call(client, "registerCallback", [stub])
+            await rpc_call(client, "registerCallback", [client.get_local_main_stub()])
             print(f"[{server_name}] Callback registered with server")
             
-            start_time = time.time()
-            last_report = start_time
-            report_interval = 30  # Report every 30 seconds
+            # Integer monotonic clock, read once per iteration against
+            # precomputed deadlines
+            start_ns = time.monotonic_ns()
+            deadline_ns = start_ns + int(duration * 1_000_000_000)
+            report_interval_ns = 30_000_000_000  # Report every 30 seconds
+            next_report_ns = start_ns + report_interval_ns
             test_case_idx = 0
             capability_test_idx = 0
             
-            while time.time() - start_time < duration:
-                elapsed = time.time() - start_time
-                
-                # Run protocol compatibility test case
-                method, args, checker, desc = PROTOCOL_TEST_CASES[test_case_idx % len(PROTOCOL_TEST_CASES)]
+            in_flight = asyncio.Semaphore(max_in_flight)
+            protocol_window = max_in_flight * WINDOW_FACTOR
+
+            # Resolve every method stub once up front; the loop then only
+            # serializes the arguments of each call.
+            main = client.get_main_stub()
+            prepared_cases = [
+                (getattr(main, method), method, args, expected, desc)
+                for method, args, expected, desc in PROTOCOL_TEST_CASES
+            ]
+            make_counter = main.makeCounter
+            trigger_callback = main.triggerCallback
+
+            async def run_case(call, method: str, args: tuple, expected: Any, desc: str) -> None:
+                nonlocal calls, passed, failed
                 try:
-                    result = await asyncio.wait_for(
-                        rpc_call(client, method, args),
-                        timeout=10.0
-                    )
-                    if checker(result):
-                        stats["protocol_tests_passed"] += 1
+                    async with in_flight:
+                        result = await call(*args)
+                    # Type must match too, so 1 does not pass for True and
+                    # 0 does not pass for None/False
+                    if isinstance(expected, ApproxEq):
+                        ok = expected.check(result)
+                    else:
+                        ok = type(result) is type(expected) and result == expected
+                    if ok:
+                        passed += 1
                     else:
-                        stats["protocol_tests_failed"] += 1
-                        stats["errors"].append(
-                            f"Protocol mismatch ({desc}): {method}({args}) returned {result}"
+                        failed += 1
+                        errors.append(
+                            f"Protocol mismatch ({desc}): {method}{args} returned {result}"
                         )
-                    stats["client_calls"] += 1
-                except asyncio.TimeoutError:
-                    stats["errors"].append(f"Timeout on {method} at {elapsed:.1f}s")
+                    calls += 1
                 except Exception as e:
-                    stats["errors"].append(f"Error on {method}: {e}")
-                
-                test_case_idx += 1
-                
-                # Capability-based feature test every 5 calls
-                if test_case_idx % 5 == 0:
-                    try:
-                        # Test: Server creates and returns a capability (Counter)
-                        counter = await asyncio.wait_for(
-                            rpc_call(client, "makeCounter", [capability_test_idx]),
-                            timeout=10.0
-                        )
-                        stats["capability_creates"] += 1
-                        
-                        # Test: Client calls method on the returned capability
-                        # The counter is returned as a stub we can call
-                        if hasattr(counter, 'increment') or isinstance(counter, dict):
-                            # Counter was returned - capability passing works
-                            stats["capability_calls"] += 1
-                        
-                        capability_test_idx += 1
-                    except asyncio.TimeoutError:
-                        stats["errors"].append(f"Timeout on capability test at {elapsed:.1f}s")
-                    except Exception as e:
-                        # Some capability features may not be fully implemented
-                        pass  # Don't count as error for now
-                
-                # Trigger server -> client callback every 10 calls
-                if test_case_idx % 10 == 0:
-                    try:
-                        result = await asyncio.wait_for(
-                            rpc_call(client, "triggerCallback", []),
-                            timeout=10.0
-                        )
-                        stats["server_callbacks"] = callback.ping_count
-                    except asyncio.TimeoutError:
-                        stats["errors"].append(f"Timeout on callback at {elapsed:.1f}s")
-                    except Exception as e:
-                        stats["errors"].append(f"Error on callback: {e}")
-                
+                    errors.append(f"Error on {method}: {e}")
+
+            async def run_capability_test(initial: int) -> None:
+                nonlocal cap_creates, cap_calls
+                try:
+                    # Test: Server creates and returns a capability (Counter)
+                    async with in_flight:
+                        counter = await make_counter(initial)
+                    cap_creates += 1
+
+                    # Test: Client calls method on the returned capability
+                    # The counter is returned as a stub we can call
+                    if isinstance(counter, RpcStub):
+                        # Counter was returned - capability passing works.
+                        # Release it once checked, or live counters fill the
+                        # session's import table at the pipelined call rate.
+                        with counter:
+                            cap_calls += 1
+                except Exception as e:
+                    # Some capability features may not be fully implemented
+                    pass  # Don't count as error for now
+
+            async def run_callback_test() -> None:
+                nonlocal callbacks
+                try:
+                    async with in_flight:
+                        await trigger_callback()
+                    callbacks = callback.ping_count
+                except Exception as e:
+                    errors.append(f"Error on callback: {e}")
+
+            while (now_ns := time.monotonic_ns()) < deadline_ns:
+                elapsed = (now_ns - start_ns) / 1e9
+
+                # Pipeline a window of protocol test cases instead of paying
+                # one round-trip per call; the semaphore admits the next call
+                # as each one completes, keeping max_in_flight outstanding.
+                window_end = test_case_idx + protocol_window
+                coros = [
+                    run_case(*prepared_cases[i % len(prepared_cases)])
+                    for i in range(test_case_idx, window_end)
+                ]
+
+                # Capability-based feature test every 5 calls and a server ->
+                # client callback every 10, counted per window so they join
+                # the same gather
+                capability_tests = window_end // 5 - test_case_idx // 5
+                coros.extend(
+                    run_capability_test(capability_test_idx + k)
+                    for k in range(capability_tests)
+                )
+                capability_test_idx += capability_tests
+                coros.extend(
+                    run_callback_test()
+                    for _ in range(window_end // 10 - test_case_idx // 10)
+                )
+                test_case_idx = window_end
+
+                # One deadline for the whole window rather than a wait_for
+                # task per call; every call it cancels counts as an error, so
+                # a stalled server still shows up in the error rate
+                tasks = [asyncio.ensure_future(coro) for coro in coros]
+                try:
+                    async with asyncio.timeout(CALL_TIMEOUT):
+                        await asyncio.gather(*tasks)
+                except TimeoutError:
+                    unfinished = sum(
+                        1 for task in tasks if not task.done() or task.cancelled()
+                    )
+                    errors.extend(
+                        [f"Timeout on call window at {elapsed:.1f}s"] * unfinished
+                    )
+
                 # Progress report
-                if time.time() - last_report >= report_interval:
+                if now_ns >= next_report_ns:
+                    flush_stats()
                     print(
                         f"[{client_lang}->{server_name}] {elapsed:.0f}s: "
-                        f"calls={stats['client_calls']}, "
-                        f"callbacks={stats['server_callbacks']}, "
-                        f"passed={stats['protocol_tests_passed']}, "
-                        f"failed={stats['protocol_tests_failed']}"
+                        f"calls={calls}, "
+                        f"callbacks={callbacks}, "
+                        f"passed={passed}, "
+                        f"failed={failed}"
                     )
-                    last_report = time.time()
-                
-                # Small delay to avoid overwhelming
-                await asyncio.sleep(0.05)
-            
+                    next_report_ns = now_ns + report_interval_ns
+
             stats["end_time"] = time.time()
             stats["actual_duration"] = stats["end_time"] - stats["start_time"]
             
     except Exception as e:
-        stats["errors"].append(f"Connection error: {e}")
+        errors.append(f"Connection error: {e}")
         stats["end_time"] = time.time()
         stats["actual_duration"] = stats["end_time"] - stats["start_time"]
+    flush_stats()
     
     # Final report
     print(f"\n{'='*60}")
@@ -263,7 +358,7 @@ class TestProtocolCompatibility:
     async def test_python_client_typescript_server(self, ts_server: ServerProcess):
         """5-minute protocol compatibility: Python client <-> TypeScript server."""
         stats = await run_protocol_compatibility_demo(
-            f"ws://127.0.0.1:{ts_server.port}/",
+            ts_server.url,
             DEMO_DURATION,
             "TypeScript",
             "Python",
@@ -282,7 +377,7 @@ class TestProtocolCompatibility:
     async def test_python_client_python_server(self, py_server: ServerProcess):
         """5-minute protocol compatibility: Python client <-> Python server."""
         stats = await run_protocol_compatibility_demo(
-            f"ws://127.0.0.1:{py_server.port}/rpc",
+            py_server.url,
             DEMO_DURATION,
             "Python",
             "Python",
@@ -312,7 +407,7 @@ if __name__ == "__main__":
         )
         return result.returncode == 0
     
-    async def main(duration: int, server_type: str, client_type: str):
+    async def main(duration: int, server_type: str, client_type: str, max_in_flight: int):
         print(f"Starting {duration}s protocol compatibility test...")
         print(f"Server: {server_type}, Client: {client_type}")
         
@@ -322,36 +417,36 @@ if __name__ == "__main__":
             ts_server = start_ts_server()
             try:
                 await run_protocol_compatibility_demo(
-                    f"ws://127.0.0.1:{ts_server.port}/",
+                    ts_server.url,
                     duration,
                     "TypeScript",
                     "Python",
+                    max_in_flight,
                 )
             finally:
                 ts_server.stop()
         
-        # Python client -> Python server
-        if server_type in ("py", "both") and client_type in ("py", "both"):
-            print("\n=== Python client -> Python server ===")
-            py_server = start_py_server()
-            try:
-                await run_protocol_compatibility_demo(
-                    f"ws://127.0.0.1:{py_server.port}/rpc",
-                    duration,
-                    "Python",
-                    "Python",
-                )
-            finally:
-                py_server.stop()
-        
-        # TypeScript client -> Python server
-        if server_type in ("py", "both") and client_type in ("ts", "both"):
-            print("\n=== TypeScript client -> Python server ===")
+        # One Python server serves both the Python and the TypeScript client
+        if server_type in ("py", "both"):
             py_server = start_py_server()
             try:
-                success = run_ts_client(py_server.port, duration)
-                if not success:
-                    print("TypeScript client test FAILED")
+                # Python client -> Python server
+                if client_type in ("py", "both"):
+                    print("\n=== Python client -> Python server ===")
+                    await run_protocol_compatibility_demo(
+                        py_server.url,
+                        duration,
+                        "Python",
+                        "Python",
+                        max_in_flight,
+                    )
+                
+                # TypeScript client -> Python server
+                if client_type in ("ts", "both"):
+                    print("\n=== TypeScript client -> Python server ===")
+                    success = run_ts_client(py_server.port, duration)
+                    if not success:
+                        print("TypeScript client test FAILED")
             finally:
                 py_server.stop()
     
@@ -359,6 +454,7 @@ if __name__ == "__main__":
     parser.add_argument("--duration", type=int, default=300, help="Test duration in seconds")
     parser.add_argument("--server", choices=["ts", "py", "both"], default="both", help="Server type")
     parser.add_argument("--client", choices=["ts", "py", "both"], default="both", help="Client type")
+    parser.add_argument("--max-in-flight", type=int, default=MAX_IN_FLIGHT, help="Maximum concurrent calls")
     args = parser.parse_args()
     
-    asyncio.run(main(args.duration, args.server, args.client))
+    asyncio.run(main(args.duration, args.server, args.client, args.max_in_flight))
@@ -7,421 +7,327 @@ specified in protocol.md.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
-import sys
-from pathlib import Path
 from typing import Any
 
 import pytest
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+from .conftest import InteropClient, InteropClientPool, new_interop_client, shared_server_url
 
-from .conftest import InteropClient, ServerProcess
+# Every test here only does I/O against the shared servers, so the whole
+# module runs on the session event loop (which the pooled clients require).
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+PRIMITIVE_VALUES = (
+    None,
+    True,
+    False,
+    0,
+    1,
+    -1,
+    42,
+    -999999,
+    3.14,
+    -2.718,
+)
+
+STRING_VALUES = (
+    "",
+    "hello",
+    "Hello, World!",
+    "line1\nline2",
+    "tab\there",
+    "quote\"here",
+    "backslash\\here",
+    "日本語",
+    "中文测试",
+    "🎉🚀💻🌍",
+    "mixed: 日本語 and emoji 🎉",
+    "special: <>&\"'",
+)
+
+# Expected/argument values built once at import; echo never mutates them.
+# Results are compared as tuples: a single C-level tuple comparison, with no
+# conversion step (array.array would both cost a copy and accept True for 1).
+_SQUARE_ARGS = tuple((i,) for i in range(50))
+_SQUARES_50 = tuple(i * i for i in range(50))
+_SQUARES_10 = _SQUARES_50[:10]
+_ECHO_VALUES = (
+    # Primitives
+    None, True, 42, 3.14, "hello",
+    # Arrays
+    [], [1, 2, 3],
+    # Objects
+    {}, {"a": 1, "b": [2, 3]},
+)
+
+# Connections opened by the round-robin concurrent-calls test.
+_POOL_CONNECTIONS = 4
+
+# Server kinds for tests that open their own connections; ``inproc`` skips the
+# subprocess and socket and can be deselected with ``-m "not inproc"``.
+_CONNECTION_KINDS = ["ts", "py", pytest.param("inproc", marks=pytest.mark.inproc)]
 
 
 # =============================================================================
 # Array Escaping Tests
 # =============================================================================
 
-@pytest.mark.asyncio
 class TestArrayEscaping:
     """Test that arrays are properly escaped as [[...]] on the wire."""
     
-    async def test_empty_array_roundtrip_ts(self, ts_server: ServerProcess):
-        """Empty array round-trips correctly through TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            result = await client.call("echo", [[]])
-            assert result == []
-    
-    async def test_empty_array_roundtrip_py(self, py_server: ServerProcess):
-        """Empty array round-trips correctly through Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result = await client.call("echo", [[]])
-            assert result == []
-    
-    async def test_simple_array_roundtrip_ts(self, ts_server: ServerProcess):
-        """Simple array round-trips correctly through TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            result = await client.call("echo", [[1, 2, 3]])
-            assert result == [1, 2, 3]
+    async def test_empty_array_roundtrip(self, interop_client: InteropClient):
+        """Empty array round-trips correctly."""
+        result = await interop_client.call("echo", [[]])
+        assert result == []
     
-    async def test_simple_array_roundtrip_py(self, py_server: ServerProcess):
-        """Simple array round-trips correctly through Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result = await client.call("echo", [[1, 2, 3]])
-            assert result == [1, 2, 3]
+    async def test_simple_array_roundtrip(self, interop_client: InteropClient):
+        """Simple array round-trips correctly."""
+        result = await interop_client.call("echo", [[1, 2, 3]])
+        assert result == [1, 2, 3]
     
-    async def test_nested_array_roundtrip_ts(self, ts_server: ServerProcess):
-        """Nested array round-trips correctly through TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            result = await client.call("echo", [[[1, 2], [3, 4]]])
-            assert result == [[1, 2], [3, 4]]
+    async def test_nested_array_roundtrip(self, interop_client: InteropClient):
+        """Nested array round-trips correctly."""
+        result = await interop_client.call("echo", [[[1, 2], [3, 4]]])
+        assert result == [[1, 2], [3, 4]]
     
-    async def test_nested_array_roundtrip_py(self, py_server: ServerProcess):
-        """Nested array round-trips correctly through Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result = await client.call("echo", [[[1, 2], [3, 4]]])
-            assert result == [[1, 2], [3, 4]]
-    
-    async def test_array_in_object_ts(self, ts_server: ServerProcess):
-        """Array inside object round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            obj = {"items": [1, 2, 3], "nested": {"arr": [4, 5]}}
-            result = await client.call("echo", [obj])
-            assert result == obj
-    
-    async def test_array_in_object_py(self, py_server: ServerProcess):
+    async def test_array_in_object(self, interop_client: InteropClient):
         """Array inside object round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            obj = {"items": [1, 2, 3], "nested": {"arr": [4, 5]}}
-            result = await client.call("echo", [obj])
-            assert result == obj
+        obj = {"items": [1, 2, 3], "nested": {"arr": [4, 5]}}
+        result = await interop_client.call("echo", [obj])
+        assert result == obj
 
 
 # =============================================================================
 # Primitive Type Tests
 # =============================================================================
 
-@pytest.mark.asyncio
 class TestPrimitiveTypes:
     """Test primitive type serialization/deserialization."""
     
-    @pytest.mark.parametrize("value", [
-        None,
-        True,
-        False,
-        0,
-        1,
-        -1,
-        42,
-        -999999,
-        3.14,
-        -2.718,
-    ])
-    async def test_primitive_roundtrip_ts(self, ts_server: ServerProcess, value):
-        """Primitive values round-trip correctly through TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            result = await client.call("echo", [value])
-            if value is None:
-                assert result is None
-            else:
-                assert result == value
-    
-    @pytest.mark.parametrize("value", [
-        None,
-        True,
-        False,
-        0,
-        1,
-        -1,
-        42,
-        -999999,
-        3.14,
-        -2.718,
-    ])
-    async def test_primitive_roundtrip_py(self, py_server: ServerProcess, value):
-        """Primitive values round-trip correctly through Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result = await client.call("echo", [value])
-            if value is None:
-                assert result is None
-            else:
-                assert result == value
+    async def test_all_primitives(self, interop_client: InteropClient):
+        """Every primitive round-trips correctly, pipelined on one connection."""
+        results = await asyncio.gather(
+            *(interop_client.call("echo", [value]) for value in PRIMITIVE_VALUES)
+        )
+        assert tuple(results) == PRIMITIVE_VALUES
+    
+    # Per-value variant, for isolating which value fails.
+    @pytest.mark.slow
+    @pytest.mark.parametrize("value", PRIMITIVE_VALUES)
+    async def test_primitive_roundtrip(self, interop_client: InteropClient, value):
+        """Primitive values round-trip correctly."""
+        result = await interop_client.call("echo", [value])
+        if value is None:
+            assert result is None
+        else:
+            assert result == value
 
 
 # =============================================================================
 # String Tests
 # =============================================================================
 
-@pytest.mark.asyncio
 class TestStrings:
     """Test string serialization including unicode."""
     
-    @pytest.mark.parametrize("value", [
-        "",
-        "hello",
-        "Hello, World!",
-        "line1\nline2",
-        "tab\there",
-        "quote\"here",
-        "backslash\\here",
-        "日本語",
-        "中文测试",
-        "🎉🚀💻🌍",
-        "mixed: 日本語 and emoji 🎉",
-        "special: <>&\"'",
-    ])
-    async def test_string_roundtrip_ts(self, ts_server: ServerProcess, value):
-        """String values round-trip correctly through TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            result = await client.call("echo", [value])
-            assert result == value
-    
-    @pytest.mark.parametrize("value", [
-        "",
-        "hello",
-        "Hello, World!",
-        "line1\nline2",
-        "tab\there",
-        "quote\"here",
-        "backslash\\here",
-        "日本語",
-        "中文测试",
-        "🎉🚀💻🌍",
-        "mixed: 日本語 and emoji 🎉",
-        "special: <>&\"'",
-    ])
-    async def test_string_roundtrip_py(self, py_server: ServerProcess, value):
-        """String values round-trip correctly through Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result = await client.call("echo", [value])
-            assert result == value
+    async def test_all_strings(self, interop_client: InteropClient):
+        """Every string round-trips correctly, pipelined on one connection."""
+        results = await asyncio.gather(
+            *(interop_client.call("echo", [value]) for value in STRING_VALUES)
+        )
+        assert tuple(results) == STRING_VALUES
+    
+    # Per-value variant, for isolating which value fails.
+    @pytest.mark.slow
+    @pytest.mark.parametrize("value", STRING_VALUES)
+    async def test_string_roundtrip(self, interop_client: InteropClient, value):
+        """String values round-trip correctly."""
+        result = await interop_client.call("echo", [value])
+        assert result == value
 
 
 # =============================================================================
 # Object Tests
 # =============================================================================
 
-@pytest.mark.asyncio
 class TestObjects:
     """Test object serialization."""
     
-    async def test_empty_object_ts(self, ts_server: ServerProcess):
-        """Empty object round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            result = await client.call("echo", [{}])
-            assert result == {}
-    
-    async def test_empty_object_py(self, py_server: ServerProcess):
+    async def test_empty_object(self, interop_client: InteropClient):
         """Empty object round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result = await client.call("echo", [{}])
-            assert result == {}
+        result = await interop_client.call("echo", [{}])
+        assert result == {}
     
-    async def test_simple_object_ts(self, ts_server: ServerProcess):
+    async def test_simple_object(self, interop_client: InteropClient):
         """Simple object round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            obj = {"key": "value", "number": 42}
-            result = await client.call("echo", [obj])
-            assert result == obj
+        obj = {"key": "value", "number": 42}
+        result = await interop_client.call("echo", [obj])
+        assert result == obj
     
-    async def test_simple_object_py(self, py_server: ServerProcess):
-        """Simple object round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            obj = {"key": "value", "number": 42}
-            result = await client.call("echo", [obj])
-            assert result == obj
-    
-    async def test_deeply_nested_object_ts(self, ts_server: ServerProcess):
+    async def test_deeply_nested_object(self, interop_client: InteropClient):
         """Deeply nested object round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            obj = {
-                "level1": {
-                    "level2": {
-                        "level3": {
-                            "level4": {
-                                "level5": {"value": "deep"}
-                            }
+        obj = {
+            "level1": {
+                "level2": {
+                    "level3": {
+                        "level4": {
+                            "level5": {"value": "deep"}
                         }
                     }
                 }
             }
-            result = await client.call("echo", [obj])
-            assert result == obj
-    
-    async def test_deeply_nested_object_py(self, py_server: ServerProcess):
-        """Deeply nested object round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            obj = {
-                "level1": {
-                    "level2": {
-                        "level3": {
-                            "level4": {
-                                "level5": {"value": "deep"}
-                            }
-                        }
-                    }
-                }
-            }
-            result = await client.call("echo", [obj])
-            assert result == obj
-    
-    async def test_complex_mixed_object_ts(self, ts_server: ServerProcess):
-        """Complex object with mixed types round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            obj = {
-                "string": "hello",
-                "number": 42,
-                "float": 3.14,
-                "bool": True,
-                "null": None,
-                "array": [1, 2, 3],
-                "nested": {"a": 1, "b": [4, 5, 6]},
-            }
-            result = await client.call("echo", [obj])
-            assert result == obj
+        }
+        result = await interop_client.call("echo", [obj])
+        assert result == obj
     
-    async def test_complex_mixed_object_py(self, py_server: ServerProcess):
+    async def test_complex_mixed_object(self, interop_client: InteropClient):
         """Complex object with mixed types round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            obj = {
-                "string": "hello",
-                "number": 42,
-                "float": 3.14,
-                "bool": True,
-                "null": None,
-                "array": [1, 2, 3],
-                "nested": {"a": 1, "b": [4, 5, 6]},
-            }
-            result = await client.call("echo", [obj])
-            assert result == obj
+        obj = {
+            "string": "hello",
+            "number": 42,
+            "float": 3.14,
+            "bool": True,
+            "null": None,
+            "array": [1, 2, 3],
+            "nested": {"a": 1, "b": [4, 5, 6]},
+        }
+        result = await interop_client.call("echo", [obj])
+        assert result == obj
 
 
 # =============================================================================
 # Method Call Tests
 # =============================================================================
 
-@pytest.mark.asyncio
 class TestMethodCalls:
     """Test various method call patterns."""
     
-    async def test_no_args_ts(self, ts_server: ServerProcess):
-        """Method with no arguments works."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            result = await client.call("returnNull", [])
-            assert result is None
-    
-    async def test_no_args_py(self, py_server: ServerProcess):
+    async def test_no_args(self, interop_client: InteropClient):
         """Method with no arguments works."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result = await client.call("returnNull", [])
-            assert result is None
-    
-    async def test_single_arg_ts(self, ts_server: ServerProcess):
-        """Method with single argument works."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            result = await client.call("square", [5])
-            assert result == 25
+        result = await interop_client.call("returnNull", [])
+        assert result is None
     
-    async def test_single_arg_py(self, py_server: ServerProcess):
+    async def test_single_arg(self, interop_client: InteropClient):
         """Method with single argument works."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result = await client.call("square", [5])
-            assert result == 25
+        result = await interop_client.call("square", [5])
+        assert result == 25
     
-    async def test_multiple_args_ts(self, ts_server: ServerProcess):
+    async def test_multiple_args(self, interop_client: InteropClient):
         """Method with multiple arguments works."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            result = await client.call("add", [3, 7])
-            assert result == 10
+        result = await interop_client.call("add", [3, 7])
+        assert result == 10
     
-    async def test_multiple_args_py(self, py_server: ServerProcess):
-        """Method with multiple arguments works."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result = await client.call("add", [3, 7])
-            assert result == 10
-    
-    async def test_array_result_ts(self, ts_server: ServerProcess):
-        """Method returning array works."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            result = await client.call("generateFibonacci", [10])
-            assert result == [0, 1, 1, 2, 3, 5, 8, 13, 21, 34]
-    
-    async def test_array_result_py(self, py_server: ServerProcess):
+    async def test_array_result(self, interop_client: InteropClient):
         """Method returning array works."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            result = await client.call("generateFibonacci", [10])
-            assert result == [0, 1, 1, 2, 3, 5, 8, 13, 21, 34]
+        result = await interop_client.call("generateFibonacci", [10])
+        assert result == [0, 1, 1, 2, 3, 5, 8, 13, 21, 34]
 
 
 # =============================================================================
 # Concurrent Call Tests
 # =============================================================================
 
-@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", _CONNECTION_KINDS)
 class TestConcurrentCalls:
     """Test concurrent RPC calls."""
     
-    async def test_concurrent_calls_ts(self, ts_server: ServerProcess):
+    async def test_concurrent_calls(self, request: pytest.FixtureRequest, kind: str):
         """Multiple concurrent calls complete correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            tasks = [
-                client.call("square", [i])
-                for i in range(10)
-            ]
-            results = await asyncio.gather(*tasks)
-            expected = [i * i for i in range(10)]
-            assert results == expected
-    
-    async def test_concurrent_calls_py(self, py_server: ServerProcess):
-        """Multiple concurrent calls complete correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            tasks = [
-                client.call("square", [i])
-                for i in range(10)
-            ]
-            results = await asyncio.gather(*tasks)
-            expected = [i * i for i in range(10)]
-            assert results == expected
-    
-    async def test_many_sequential_calls_ts(self, ts_server: ServerProcess):
-        """Many sequential calls complete correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            for i in range(50):
-                result = await client.call("square", [i])
-                assert result == i * i
-    
-    async def test_many_sequential_calls_py(self, py_server: ServerProcess):
-        """Many sequential calls complete correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            for i in range(50):
-                result = await client.call("square", [i])
-                assert result == i * i
+        async with new_interop_client(request, kind) as client:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(client.call("square", _SQUARE_ARGS[i]))
+                    for i in range(10)
+                ]
+            assert tuple(t.result() for t in tasks) == _SQUARES_10
+    
+    async def test_concurrent_calls_across_connections(
+        self, request: pytest.FixtureRequest, kind: str
+    ):
+        """Concurrent calls spread round-robin over a warm connection pool."""
+        async with contextlib.AsyncExitStack() as stack:
+            clients = await asyncio.gather(*(
+                stack.enter_async_context(new_interop_client(request, kind))
+                for _ in range(_POOL_CONNECTIONS)
+            ))
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(clients[i % len(clients)].call("square", _SQUARE_ARGS[i]))
+                    for i in range(10)
+                ]
+            assert tuple(t.result() for t in tasks) == _SQUARES_10
+    
+    async def test_many_sequential_calls(self, request: pytest.FixtureRequest, kind: str):
+        """Sequential calls complete correctly: 10 calls in chunks of 5."""
+        async with new_interop_client(request, kind) as client:
+            await _square_in_chunks(client, count=10, chunk=5)
+    
+    @pytest.mark.slow
+    async def test_many_sequential_calls_full(self, request: pytest.FixtureRequest, kind: str):
+        """The full run: 50 calls in chunks of 10."""
+        async with new_interop_client(request, kind) as client:
+            await _square_in_chunks(client, count=50, chunk=10)
+
+
+async def _square_in_chunks(client: InteropClient, count: int, chunk: int) -> None:
+    """square(0..count-1), one chunk in flight at a time.
+
+    Each call checks its own result as soon as it arrives, while the rest of
+    the chunk is still on the wire. The TaskGroup cancels the chunk's other
+    calls if one check fails, so no task outlives the test.
+    """
+    square = client.method("square")
+
+    async def checked(i: int) -> None:
+        assert await square(*_SQUARE_ARGS[i]) == _SQUARES_50[i], f"square({i})"
+
+    for base in range(0, count, chunk):
+        async with asyncio.TaskGroup() as tg:
+            for i in range(base, min(base + chunk, count)):
+                tg.create_task(checked(i))
 
 
 # =============================================================================
 # Cross-Language Specific Tests
 # =============================================================================
 
-@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", ["ts", "py"])
 class TestCrossLanguage:
-    """Tests specifically for cross-language interop."""
-    
-    async def test_py_client_ts_server_all_types(self, ts_server: ServerProcess):
-        """Python client can send/receive all types to TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
-            # Primitives
-            assert await client.call("echo", [None]) is None
-            assert await client.call("echo", [True]) is True
-            assert await client.call("echo", [42]) == 42
-            assert await client.call("echo", [3.14]) == 3.14
-            assert await client.call("echo", ["hello"]) == "hello"
-            
-            # Arrays
-            assert await client.call("echo", [[]]) == []
-            assert await client.call("echo", [[1, 2, 3]]) == [1, 2, 3]
-            
-            # Objects
-            assert await client.call("echo", [{}]) == {}
-            obj = {"a": 1, "b": [2, 3]}
-            assert await client.call("echo", [obj]) == obj
-    
-    async def test_py_client_py_server_all_types(self, py_server: ServerProcess):
-        """Python client can send/receive all types to Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
-            # Primitives
-            assert await client.call("echo", [None]) is None
-            assert await client.call("echo", [True]) is True
-            assert await client.call("echo", [42]) == 42
-            assert await client.call("echo", [3.14]) == 3.14
-            assert await client.call("echo", ["hello"]) == "hello"
-            
-            # Arrays
-            assert await client.call("echo", [[]]) == []
-            assert await client.call("echo", [[1, 2, 3]]) == [1, 2, 3]
-            
-            # Objects
-            assert await client.call("echo", [{}]) == {}
-            obj = {"a": 1, "b": [2, 3]}
-            assert await client.call("echo", [obj]) == obj
+    """Tests specifically for cross-language interop.
+
+    Runs on the session pool's connection to each real server, so the
+    class pays no WebSocket handshake of its own.
+    """
+    
+    async def test_py_client_all_types(
+        self, request: pytest.FixtureRequest, kind: str, interop_pool: InteropClientPool
+    ):
+        """Python client can send/receive all types to each server."""
+        client = await interop_pool.get_client(shared_server_url(request, kind))
+        # One echo of the whole list: one frame each way instead of nine.
+        # Top-level primitives are covered by TestPrimitiveTypes.
+        results = await client.call("echo", [list(_ECHO_VALUES)])
+        assert tuple(results) == _ECHO_VALUES
+        # Identity checks for the singletons; == would accept 1 for True
+        assert results[0] is None
+        assert results[1] is True
+
+
+# =============================================================================
+# Event Loop
+# =============================================================================
+
+async def test_session_loop_is_uvloop():
+    """The shared-client tests run on uvloop when it is installed."""
+    uvloop = pytest.importorskip("uvloop")
+    assert isinstance(asyncio.get_running_loop(), uvloop.Loop)
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_function_loop_is_uvloop():
+    """Per-test loops come from the same uvloop factory."""
+    uvloop = pytest.importorskip("uvloop")
+    assert isinstance(asyncio.get_running_loop(), uvloop.Loop)
@@ -14,16 +14,11 @@ from __future__ import annotations
 import asyncio
 import base64
 import math
-import sys
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Any
 
 import pytest
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 from .conftest import InteropClient, ServerProcess
 
 
@@ -37,7 +32,7 @@ class TestBytes:
     
     async def test_bytes_roundtrip_ts(self, ts_server: ServerProcess):
         """Bytes round-trip correctly through TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             # Create bytes on server and get them back
             data = await client.call("makeBytes", ["SGVsbG8gV29ybGQ="])  # "Hello World"
             assert isinstance(data, bytes)
@@ -45,14 +40,14 @@ class TestBytes:
     
     async def test_bytes_roundtrip_py(self, py_server: ServerProcess):
         """Bytes round-trip correctly through Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             data = await client.call("makeBytes", ["SGVsbG8gV29ybGQ="])
             assert isinstance(data, bytes)
             assert data == b"Hello World"
     
     async def test_bytes_echo_ts(self, ts_server: ServerProcess):
         """Bytes can be sent to and echoed from TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             original = b"Binary data \x00\x01\x02\xff"
             result = await client.call("echoBytes", [original])
             assert isinstance(result, bytes)
@@ -60,7 +55,7 @@ class TestBytes:
     
     async def test_bytes_echo_py(self, py_server: ServerProcess):
         """Bytes can be sent to and echoed from Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             original = b"Binary data \x00\x01\x02\xff"
             result = await client.call("echoBytes", [original])
             assert isinstance(result, bytes)
@@ -68,35 +63,35 @@ class TestBytes:
     
     async def test_bytes_length_ts(self, ts_server: ServerProcess):
         """Server can process bytes and return length."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             data = b"Hello World"
             length = await client.call("getBytesLength", [data])
             assert length == 11
     
     async def test_bytes_length_py(self, py_server: ServerProcess):
         """Server can process bytes and return length."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             data = b"Hello World"
             length = await client.call("getBytesLength", [data])
             assert length == 11
     
     async def test_empty_bytes_ts(self, ts_server: ServerProcess):
         """Empty bytes round-trip correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             result = await client.call("echoBytes", [b""])
             assert isinstance(result, bytes)
             assert result == b""
     
     async def test_empty_bytes_py(self, py_server: ServerProcess):
         """Empty bytes round-trip correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             result = await client.call("echoBytes", [b""])
             assert isinstance(result, bytes)
             assert result == b""
     
     async def test_large_bytes_ts(self, ts_server: ServerProcess):
         """Large bytes (10KB) round-trip correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             original = bytes(range(256)) * 40  # 10KB
             result = await client.call("echoBytes", [original])
             assert isinstance(result, bytes)
@@ -104,7 +99,7 @@ class TestBytes:
     
     async def test_large_bytes_py(self, py_server: ServerProcess):
         """Large bytes (10KB) round-trip correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             original = bytes(range(256)) * 40  # 10KB
             result = await client.call("echoBytes", [original])
             assert isinstance(result, bytes)
@@ -121,7 +116,7 @@ class TestDate:
     
     async def test_date_roundtrip_ts(self, ts_server: ServerProcess):
         """Date round-trips correctly through TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             # Create date on server: 2024-01-15T12:30:00Z = 1705322200000ms
             timestamp = 1705322200000
             date = await client.call("makeDate", [timestamp])
@@ -130,7 +125,7 @@ class TestDate:
     
     async def test_date_roundtrip_py(self, py_server: ServerProcess):
         """Date round-trips correctly through Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             timestamp = 1705322200000
             date = await client.call("makeDate", [timestamp])
             assert isinstance(date, datetime)
@@ -138,7 +133,7 @@ class TestDate:
     
     async def test_date_echo_ts(self, ts_server: ServerProcess):
         """Date can be sent to and echoed from TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             original = datetime(2024, 1, 15, 12, 30, 0, tzinfo=timezone.utc)
             result = await client.call("echoDate", [original])
             assert isinstance(result, datetime)
@@ -146,7 +141,7 @@ class TestDate:
     
     async def test_date_echo_py(self, py_server: ServerProcess):
         """Date can be sent to and echoed from Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             original = datetime(2024, 1, 15, 12, 30, 0, tzinfo=timezone.utc)
             result = await client.call("echoDate", [original])
             assert isinstance(result, datetime)
@@ -154,7 +149,7 @@ class TestDate:
     
     async def test_date_timestamp_ts(self, ts_server: ServerProcess):
         """Server can extract timestamp from date."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             date = datetime(2024, 1, 15, 12, 30, 0, tzinfo=timezone.utc)
             timestamp = await client.call("getTimestamp", [date])
             expected = int(date.timestamp() * 1000)
@@ -162,7 +157,7 @@ class TestDate:
     
     async def test_date_timestamp_py(self, py_server: ServerProcess):
         """Server can extract timestamp from date."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             date = datetime(2024, 1, 15, 12, 30, 0, tzinfo=timezone.utc)
             timestamp = await client.call("getTimestamp", [date])
             expected = int(date.timestamp() * 1000)
@@ -170,7 +165,7 @@ class TestDate:
     
     async def test_epoch_date_ts(self, ts_server: ServerProcess):
         """Unix epoch date round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             epoch = datetime(1970, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
             result = await client.call("echoDate", [epoch])
             assert isinstance(result, datetime)
@@ -178,7 +173,7 @@ class TestDate:
     
     async def test_epoch_date_py(self, py_server: ServerProcess):
         """Unix epoch date round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             epoch = datetime(1970, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
             result = await client.call("echoDate", [epoch])
             assert isinstance(result, datetime)
@@ -199,7 +194,7 @@ class TestBigInt:
     
     async def test_bigint_roundtrip_ts(self, ts_server: ServerProcess):
         """BigInt round-trips correctly through TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             # Create bigint on server
             result = await client.call("makeBigInt", ["12345678901234567890"])
             assert isinstance(result, int)
@@ -207,14 +202,14 @@ class TestBigInt:
     
     async def test_bigint_roundtrip_py(self, py_server: ServerProcess):
         """BigInt round-trips correctly through Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             result = await client.call("makeBigInt", ["12345678901234567890"])
             assert isinstance(result, int)
             assert result == 12345678901234567890
     
     async def test_bigint_echo_ts(self, ts_server: ServerProcess):
         """BigInt can be sent to and echoed from TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             # Python int larger than JS safe integer
             original = 2**63
             result = await client.call("echoBigInt", [original])
@@ -223,7 +218,7 @@ class TestBigInt:
     
     async def test_bigint_echo_py(self, py_server: ServerProcess):
         """BigInt can be sent to and echoed from Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             original = 2**63
             result = await client.call("echoBigInt", [original])
             assert isinstance(result, int)
@@ -231,21 +226,21 @@ class TestBigInt:
     
     async def test_bigint_string_ts(self, ts_server: ServerProcess):
         """Server can convert bigint to string."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             value = 2**100
             result = await client.call("getBigIntString", [value])
             assert result == str(value)
     
     async def test_bigint_string_py(self, py_server: ServerProcess):
         """Server can convert bigint to string."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             value = 2**100
             result = await client.call("getBigIntString", [value])
             assert result == str(value)
     
     async def test_negative_bigint_ts(self, ts_server: ServerProcess):
         """Negative bigint round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             original = -(2**63)
             result = await client.call("echoBigInt", [original])
             assert isinstance(result, int)
@@ -253,7 +248,7 @@ class TestBigInt:
     
     async def test_negative_bigint_py(self, py_server: ServerProcess):
         """Negative bigint round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             original = -(2**63)
             result = await client.call("echoBigInt", [original])
             assert isinstance(result, int)
@@ -261,14 +256,14 @@ class TestBigInt:
     
     async def test_zero_bigint_ts(self, ts_server: ServerProcess):
         """Zero bigint round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             result = await client.call("makeBigInt", ["0"])
             assert isinstance(result, int)
             assert result == 0
     
     async def test_zero_bigint_py(self, py_server: ServerProcess):
         """Zero bigint round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             result = await client.call("makeBigInt", ["0"])
             assert isinstance(result, int)
             assert result == 0
@@ -284,77 +279,77 @@ class TestSpecialNumbers:
     
     async def test_infinity_ts(self, ts_server: ServerProcess):
         """Infinity is returned correctly from TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             result = await client.call("returnInfinity", [])
             assert result == float('inf')
             assert math.isinf(result) and result > 0
     
     async def test_infinity_py(self, py_server: ServerProcess):
         """Infinity is returned correctly from Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             result = await client.call("returnInfinity", [])
             assert result == float('inf')
             assert math.isinf(result) and result > 0
     
     async def test_negative_infinity_ts(self, ts_server: ServerProcess):
         """Negative infinity is returned correctly from TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             result = await client.call("returnNegativeInfinity", [])
             assert result == float('-inf')
             assert math.isinf(result) and result < 0
     
     async def test_negative_infinity_py(self, py_server: ServerProcess):
         """Negative infinity is returned correctly from Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             result = await client.call("returnNegativeInfinity", [])
             assert result == float('-inf')
             assert math.isinf(result) and result < 0
     
     async def test_nan_ts(self, ts_server: ServerProcess):
         """NaN is returned correctly from TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             result = await client.call("returnNaN", [])
             assert math.isnan(result)
     
     async def test_nan_py(self, py_server: ServerProcess):
         """NaN is returned correctly from Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             result = await client.call("returnNaN", [])
             assert math.isnan(result)
     
     async def test_infinity_echo_ts(self, ts_server: ServerProcess):
         """Infinity can be sent to and echoed from TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             result = await client.call("echo", [float('inf')])
             assert result == float('inf')
     
     async def test_infinity_echo_py(self, py_server: ServerProcess):
         """Infinity can be sent to and echoed from Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             result = await client.call("echo", [float('inf')])
             assert result == float('inf')
     
     async def test_negative_infinity_echo_ts(self, ts_server: ServerProcess):
         """Negative infinity can be sent to and echoed from TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             result = await client.call("echo", [float('-inf')])
             assert result == float('-inf')
     
     async def test_negative_infinity_echo_py(self, py_server: ServerProcess):
         """Negative infinity can be sent to and echoed from Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             result = await client.call("echo", [float('-inf')])
             assert result == float('-inf')
     
     async def test_nan_echo_ts(self, ts_server: ServerProcess):
         """NaN can be sent to and echoed from TypeScript server."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             result = await client.call("echo", [float('nan')])
             assert math.isnan(result)
     
     async def test_nan_echo_py(self, py_server: ServerProcess):
         """NaN can be sent to and echoed from Python server."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             result = await client.call("echo", [float('nan')])
             assert math.isnan(result)
 
@@ -377,14 +372,14 @@ class TestUndefined:
         """
         from capnweb import Undefined
 
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             result = await client.call("returnUndefined", [])
             assert result is Undefined
             assert not result
 
     async def test_undefined_return_py(self, py_server: ServerProcess):
         """The Python server returns None, which serializes as null."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             result = await client.call("returnUndefined", [])
             assert result is None
 
@@ -392,7 +387,7 @@ class TestUndefined:
         """Null and undefined stay DISTINCT through a Python hop (D5)."""
         from capnweb import Undefined
 
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             null_result = await client.call("returnNull", [])
             undefined_result = await client.call("returnUndefined", [])
             assert null_result is None
@@ -401,7 +396,7 @@ class TestUndefined:
 
     async def test_null_vs_undefined_py(self, py_server: ServerProcess):
         """The Python server returns None for both; both arrive as None."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             null_result = await client.call("returnNull", [])
             undefined_result = await client.call("returnUndefined", [])
             assert null_result is None
@@ -418,7 +413,7 @@ class TestMixedSpecialForms:
     
     async def test_object_with_bytes_ts(self, ts_server: ServerProcess):
         """Object containing bytes round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             obj = {"data": b"binary", "name": "test"}
             result = await client.call("echo", [obj])
             assert result["name"] == "test"
@@ -426,7 +421,7 @@ class TestMixedSpecialForms:
     
     async def test_object_with_bytes_py(self, py_server: ServerProcess):
         """Object containing bytes round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             obj = {"data": b"binary", "name": "test"}
             result = await client.call("echo", [obj])
             assert result["name"] == "test"
@@ -434,7 +429,7 @@ class TestMixedSpecialForms:
     
     async def test_object_with_date_ts(self, ts_server: ServerProcess):
         """Object containing date round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             date = datetime(2024, 1, 15, 12, 30, 0, tzinfo=timezone.utc)
             obj = {"created": date, "name": "test"}
             result = await client.call("echo", [obj])
@@ -444,7 +439,7 @@ class TestMixedSpecialForms:
     
     async def test_object_with_date_py(self, py_server: ServerProcess):
         """Object containing date round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             date = datetime(2024, 1, 15, 12, 30, 0, tzinfo=timezone.utc)
             obj = {"created": date, "name": "test"}
             result = await client.call("echo", [obj])
@@ -454,7 +449,7 @@ class TestMixedSpecialForms:
     
     async def test_array_with_special_numbers_ts(self, ts_server: ServerProcess):
         """Array containing special numbers round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             arr = [1, float('inf'), float('-inf'), 3.14]
             result = await client.call("echo", [arr])
             assert result[0] == 1
@@ -464,7 +459,7 @@ class TestMixedSpecialForms:
     
     async def test_array_with_special_numbers_py(self, py_server: ServerProcess):
         """Array containing special numbers round-trips correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             arr = [1, float('inf'), float('-inf'), 3.14]
             result = await client.call("echo", [arr])
             assert result[0] == 1
@@ -21,11 +21,11 @@ tests/test_b1_streams.py; the TS-facing cancel path is exercised by item 5.)
 from __future__ import annotations
 
 import asyncio
-import json
 from typing import Any
 
 import pytest
 
+from capnweb import _json
 from capnweb.error import RpcError
 from capnweb.payload import RpcPayload
 from capnweb.streams import FlowController, RpcReadableStream, RpcWritableStream
@@ -102,18 +102,18 @@ class SessionClient:
     def frames_of(self, msg_type: str) -> list[list[Any]]:
         out = []
         for frame in self.sent_frames:
-            parsed = json.loads(frame)
+            parsed = _json.loads(frame)
             if parsed[0] == msg_type:
                 out.append(parsed)
         return out
 
     def frame_kinds(self) -> list[str]:
-        return [json.loads(f)[0] for f in self.sent_frames]
+        return [_json.loads(f)[0] for f in self.sent_frames]
 
 
 @pytest.fixture
 async def client(ts_server):  # noqa: ANN001 - conftest fixture
-    async with SessionClient(f"ws://127.0.0.1:{ts_server.port}/") as c:
+    async with SessionClient(ts_server.url) as c:
         yield c
 
 
@@ -410,7 +410,7 @@ class TestBookkeeping:
         )
         assert result == chunks
 
-        new_frames = [json.loads(f) for f in client.sent_frames[base_frames:]]
+        new_frames = [_json.loads(f) for f in client.sent_frames[base_frames:]]
         stream_frames = [f for f in new_frames if f[0] == "stream"]
         assert len(stream_frames) == 26  # 25 writes + close
 
@@ -473,7 +473,7 @@ class TestSessionAbortMidStream:
             await within(hook.pull())
 
     async def test_transport_death_mid_ts_to_py_stream(self, ts_server) -> None:
-        async with SessionClient(f"ws://127.0.0.1:{ts_server.port}/") as c:
+        async with SessionClient(ts_server.url) as c:
             stream = await c.call("makeByteStream", [8 * 1024 * 1024, 8 * 1024])
             # Read a little, then kill the session under the reader.
             await within(stream.read())
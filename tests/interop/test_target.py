@@ -49,10 +49,19 @@ class TestTarget(RpcTarget):
     - echo(value) -> value
     - add(a, b) -> a + b
     - greet(name) -> "Hello, {name}!"
+
+    Holds per-connection state (the registerCallback stub), so servers
+    create one instance per session rather than sharing a singleton.
     """
     
+    _callback = None
+    
     async def call(self, method: str, args: list) -> any:
-        if method == "square":
+        # echo is the hottest method in the interop suites; test it first.
+        if method == "echo":
+            return args[0] if args else None
+        
+        elif method == "square":
             return args[0] * args[0]
         
         elif method == "callSquare":
@@ -107,9 +116,6 @@ class TestTarget(RpcTarget):
         elif method == "returnNumber":
             return args[0]
         
-        elif method == "echo":
-            return args[0] if args else None
-        
         elif method == "add":
             return args[0] + args[1]
         
@@ -171,7 +177,7 @@ class TestTarget(RpcTarget):
             return "registered"
         
         elif method == "triggerCallback":
-            if not hasattr(self, '_callback') or self._callback is None:
+            if self._callback is None:
                 return "no callback"
             hook = (
                 self._callback._hook
@@ -23,32 +23,32 @@ class TestClientTimeout:
     
     async def test_fast_call_within_timeout_ts(self, ts_server: ServerProcess):
         """Fast call completes within timeout."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             result = await client.call_with_timeout("square", [5], timeout=5.0)
             assert result == 25
     
     async def test_fast_call_within_timeout_py(self, py_server: ServerProcess):
         """Fast call completes within timeout."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             result = await client.call_with_timeout("square", [5], timeout=5.0)
             assert result == 25
     
     async def test_timeout_on_slow_call_ts(self, ts_server: ServerProcess):
         """Slow call times out correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             with pytest.raises(asyncio.TimeoutError):
                 # slowMethod takes 5 seconds, timeout is 0.1
                 await client.call_with_timeout("slowMethod", [5000], timeout=0.1)
     
     async def test_timeout_on_slow_call_py(self, py_server: ServerProcess):
         """Slow call times out correctly."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             with pytest.raises(asyncio.TimeoutError):
                 await client.call_with_timeout("slowMethod", [5000], timeout=0.1)
     
     async def test_call_after_timeout_ts(self, ts_server: ServerProcess):
         """Can make calls after a timeout."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             # First call times out
             try:
                 await client.call_with_timeout("slowMethod", [5000], timeout=0.1)
@@ -64,7 +64,7 @@ class TestClientTimeout:
     
     async def test_call_after_timeout_py(self, py_server: ServerProcess):
         """Can make calls after a timeout."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             try:
                 await client.call_with_timeout("slowMethod", [5000], timeout=0.1)
             except asyncio.TimeoutError:
@@ -86,7 +86,7 @@ class TestConcurrentTimeout:
     
     async def test_some_calls_timeout_ts(self, ts_server: ServerProcess):
         """Some calls timing out doesn't affect others."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             async def fast_call():
                 return await client.call_with_timeout("square", [5], timeout=5.0)
             
@@ -107,7 +107,7 @@ class TestConcurrentTimeout:
     
     async def test_some_calls_timeout_py(self, py_server: ServerProcess):
         """Some calls timing out doesn't affect others."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             async def fast_call():
                 return await client.call_with_timeout("square", [5], timeout=5.0)
             
@@ -137,19 +137,19 @@ class TestTimeoutEdgeCases:
     
     async def test_zero_timeout_ts(self, ts_server: ServerProcess):
         """Zero timeout raises immediately."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             with pytest.raises(asyncio.TimeoutError):
                 await client.call_with_timeout("square", [5], timeout=0)
     
     async def test_zero_timeout_py(self, py_server: ServerProcess):
         """Zero timeout raises immediately."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             with pytest.raises(asyncio.TimeoutError):
                 await client.call_with_timeout("square", [5], timeout=0)
     
     async def test_very_short_timeout_ts(self, ts_server: ServerProcess):
         """Very short timeout (0.001s) may or may not complete."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             try:
                 result = await client.call_with_timeout("square", [5], timeout=0.001)
                 # If it completes, result should be correct
@@ -160,7 +160,7 @@ class TestTimeoutEdgeCases:
     
     async def test_very_short_timeout_py(self, py_server: ServerProcess):
         """Very short timeout (0.001s) may or may not complete."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             try:
                 result = await client.call_with_timeout("square", [5], timeout=0.001)
                 assert result == 25
@@ -169,14 +169,14 @@ class TestTimeoutEdgeCases:
     
     async def test_generous_timeout_ts(self, ts_server: ServerProcess):
         """Generous timeout allows slow calls to complete."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             # slowMethod with 100ms delay should complete within 5s timeout
             result = await client.call_with_timeout("slowMethod", [100], timeout=5.0)
             assert result == "slow result after 100ms"
     
     async def test_generous_timeout_py(self, py_server: ServerProcess):
         """Generous timeout allows slow calls to complete."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             result = await client.call_with_timeout("slowMethod", [100], timeout=5.0)
             assert result == "slow result after 100ms"
 
@@ -191,7 +191,7 @@ class TestCapabilityTimeout:
     
     async def test_timeout_during_capability_call_ts(self, ts_server: ServerProcess):
         """Timeout during a capability method call."""
-        async with InteropClient(f"ws://127.0.0.1:{ts_server.port}/") as client:
+        async with InteropClient(ts_server.url) as client:
             # Create a counter capability
             counter = await client.call("makeCounter", [0])
             assert counter is not None
@@ -201,6 +201,6 @@ class TestCapabilityTimeout:
     
     async def test_timeout_during_capability_call_py(self, py_server: ServerProcess):
         """Timeout during a capability method call."""
-        async with InteropClient(f"ws://127.0.0.1:{py_server.port}/rpc") as client:
+        async with InteropClient(py_server.url) as client:
             counter = await client.call("makeCounter", [0])
             assert counter is not None
@@ -298,6 +298,29 @@ class TestUnifiedRpcHandler:
         finally:
             await runner.cleanup()
 
+    async def test_timed_out_batch_keeps_acao(self) -> None:
+        api = SimpleApi()
+        options = RpcSessionConfig(drain_timeout=0.2)
+
+        async def handler(request: web.Request) -> web.StreamResponse:
+            return await aiohttp_rpc_handler(request, api, options)
+
+        app = web.Application()
+        app.router.add_route("*", "/rpc", handler)
+        runner, port = await start_site(app)
+        try:
+            push = json.dumps(["push", ["pipeline", 0, ["hang"], []]])
+            pull = json.dumps(["pull", 1])
+            async with ClientSession() as client:
+                async with client.post(
+                    f"http://127.0.0.1:{port}/rpc", data=f"{push}\n{pull}"
+                ) as resp:
+                    assert resp.status == 500
+                    assert resp.headers["Access-Control-Allow-Origin"] == "*"
+                    assert "refusing to return" in await resp.text()
+        finally:
+            await runner.cleanup()
+
     async def test_websocket_upgrade_routes_to_ws_session(self) -> None:
         from capnweb.ws_session import new_websocket_rpc_session
 
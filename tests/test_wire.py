@@ -250,6 +250,15 @@ class TestBatchOperations:
         assert isinstance(messages[1], WirePull)
         assert isinstance(messages[2], WireRelease)
 
+    def test_parse_batch_bytes(self) -> None:
+        """Raw UTF-8 frames (WS BINARY) parse without a decode step."""
+        assert isinstance(parse_wire_batch(b'["pull", 42]')[0], WirePull)
+        messages = parse_wire_batch('["push", "é"]\n["pull", 42]'.encode())
+
+        assert len(messages) == 2
+        assert isinstance(messages[0], WirePush)
+        assert isinstance(messages[1], WirePull)
+
     def test_roundtrip_batch(self) -> None:
         """Test serialization and parsing roundtrip."""
         original: list[WireMessage] = [WirePush(123), WirePull(42)]
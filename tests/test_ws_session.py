@@ -4,6 +4,8 @@ These tests verify the full bidirectional RPC functionality without mocks.
 """
 
 import asyncio
+
+import aiohttp
 import pytest
 
 from capnweb.payload import RpcPayload
@@ -105,6 +107,34 @@ class TestWebSocketRpcBasic:
         finally:
             await server.stop()
 
+    async def test_shared_http_session_left_open(self):
+        """A caller-supplied ClientSession is reused and not closed."""
+        server = WebSocketRpcServer(EchoService(), port=9013)
+        await server.start()
+
+        try:
+            async with aiohttp.ClientSession() as http:
+                for i in range(2):
+                    async with WebSocketRpcClient(
+                        "ws://localhost:9013/rpc", http_session=http
+                    ) as client:
+                        assert await rpc_call(client, "echo", [i]) == i
+                    assert not http.closed
+        finally:
+            await server.stop()
+
+    async def test_frame_above_aiohttp_default_cap(self):
+        """Frames up to max_message_bytes pass aiohttp's own 4 MiB cap."""
+        server = WebSocketRpcServer(EchoService(), port=9014)
+        await server.start()
+
+        try:
+            async with WebSocketRpcClient("ws://localhost:9014/rpc") as client:
+                big = "x" * (5 * 1024 * 1024)
+                assert await rpc_call(client, "echo", [big]) == big
+        finally:
+            await server.stop()
+
 
 @pytest.mark.asyncio
 class TestWebSocketRpcConcurrent:
@@ -262,6 +292,61 @@ class TestWebSocketRpcBidirectional:
         finally:
             await server.stop()
 
+    async def test_local_main_stub_is_cached(self):
+        """get_local_main_stub() returns one stub, sendable repeatedly and released on close."""
+        class CallbackService(RpcTarget):
+            def __init__(self):
+                self.callback = None
+
+            async def call(self, method: str, args: list) -> any:
+                if method == "register_callback":
+                    self.callback = args[0]
+                    return "registered"
+                elif method == "trigger_callback":
+                    return await self.callback.notify("ping")
+                raise ValueError(f"Unknown method: {method}")
+
+            def get_property(self, name: str) -> any:
+                raise AttributeError(f"Unknown property: {name}")
+
+        class ClientCallback(RpcTarget):
+            async def call(self, method: str, args: list) -> any:
+                if method == "notify":
+                    return f"Got: {args[0]}"
+                raise ValueError(f"Unknown method: {method}")
+
+            def get_property(self, name: str) -> any:
+                raise AttributeError(f"Unknown property: {name}")
+
+        server = WebSocketRpcServer(CallbackService(), port=9015)
+        await server.start()
+
+        try:
+            async with WebSocketRpcClient(
+                "ws://localhost:9015/rpc",
+                local_main=ClientCallback(),
+            ) as client:
+                stub = client.get_local_main_stub()
+                assert client.get_local_main_stub() is stub
+
+                for _ in range(2):
+                    result = await rpc_call(client, "register_callback", [stub])
+                    assert result == "registered"
+                    result = await rpc_call(client, "trigger_callback", [])
+                    assert result == "Got: ping"
+
+            # close() releases the cached stub's reference along with the
+            # session's own (no sends here, so nothing else holds one)
+            async with WebSocketRpcClient(
+                "ws://localhost:9015/rpc",
+                local_main=ClientCallback(),
+            ) as client:
+                local_hook = client._session.get_export(0)
+                client.get_local_main_stub()
+            assert local_hook.ref_count == 0
+        finally:
+            await server.stop()
+
 
 @pytest.mark.asyncio
 class TestWebSocketRpcDrain: